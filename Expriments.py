@@ -1,151 +1,308 @@
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
-
-# Create PDF
-pdf = SimpleDocTemplate("bakery_automation_brochure.pdf", pagesize=A4,
-                        rightMargin=20*mm, leftMargin=20*mm,
-                        topMargin=20*mm, bottomMargin=20*mm)
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import paragraph as rl_paragraph, tables as rl_tables
+import functools
+import hashlib
+import os
+import sys
+
+OUTPUT_PATH = "bakery_automation_brochure.pdf"
+HASH_PATH = ".brochure.hash"
+
+# All brochure content and styling lives in this file, so its hash identifies the output
+with open(__file__, "rb") as f:
+    source_hash = hashlib.blake2b(f.read()).hexdigest()
+
+# Skip only if the PDF is still there (a deleted or empty PDF is always rebuilt)
+if os.path.isfile(OUTPUT_PATH) and os.path.getsize(OUTPUT_PATH) > 0 and os.path.exists(HASH_PATH):
+    with open(HASH_PATH) as f:
+        if f.read().strip() == source_hash:
+            print(f"PDF up to date: {OUTPUT_PATH}")
+            sys.exit(0)
+
+# Drop the stale hash first so an interrupted build is never mistaken for up to date
+if os.path.exists(HASH_PATH):
+    os.remove(HASH_PATH)
+
+# Table sizing and Paragraph wrapping measure the same strings over and over.
+# Both modules bind stringWidth by name at import, so patch their references too.
+_string_width = functools.lru_cache(maxsize=8192)(pdfmetrics.stringWidth)
+for _module in (pdfmetrics, rl_tables, rl_paragraph):
+    if hasattr(_module, 'stringWidth'):
+        _module.stringWidth = _string_width
+
+# Create PDF: every page uses the same single-column frame, so one PageTemplate is enough
+MARGIN = 20*mm
+frame = Frame(MARGIN, MARGIN, A4[0] - 2*MARGIN, A4[1] - 2*MARGIN, id='main')
+pdf = BaseDocTemplate(OUTPUT_PATH, pagesize=A4,
+                      rightMargin=MARGIN, leftMargin=MARGIN,
+                      topMargin=MARGIN, bottomMargin=MARGIN,
+                      pageTemplates=[PageTemplate(id='page', frames=[frame])])
 
 # Container for elements
 elements = []
 
+# Flowables keyed by (text, style) so repeated lines share one parsed Paragraph
+_para_cache = {}
+
+def P(text, style):
+    key = (text, id(style))
+    para = _para_cache.get(key)
+    if para is None:
+        para = _para_cache[key] = Paragraph(text, style)
+    return para
+
+# Palette
+C_DARK = colors.HexColor('#2c3e50')
+C_GREY = colors.HexColor('#7f8c8d')
+C_SLATE = colors.HexColor('#34495e')
+C_BODY = colors.HexColor('#333333')
+C_BG = colors.HexColor('#f8f9fa')
+C_BLUE = colors.HexColor('#3498db')
+C_LINE = colors.HexColor('#ecf0f1')
+C_BORDER = colors.HexColor('#bdc3c7')
+C_WHITE = colors.white
+
 # Styles
 styles = getSampleStyleSheet()
 
-# Custom styles
-title_style = ParagraphStyle(
-    'CustomTitle',
-    parent=styles['Heading1'],
-    fontSize=28,
-    textColor=colors.HexColor('#2c3e50'),
-    spaceAfter=12,
-    alignment=TA_CENTER,
-    fontName='Helvetica-Bold'
-)
-
-tagline_style = ParagraphStyle(
-    'Tagline',
-    parent=styles['Normal'],
-    fontSize=14,
-    textColor=colors.HexColor('#7f8c8d'),
-    spaceAfter=20,
-    alignment=TA_CENTER,
-    fontName='Helvetica'
-)
-
-heading_style = ParagraphStyle(
-    'CustomHeading',
-    parent=styles['Heading2'],
-    fontSize=18,
-    textColor=colors.HexColor('#2c3e50'),
-    spaceAfter=12,
-    spaceBefore=16,
-    fontName='Helvetica-Bold',
-    leftIndent=10
-)
-
-subheading_style = ParagraphStyle(
-    'CustomSubHeading',
-    parent=styles['Heading3'],
-    fontSize=14,
-    textColor=colors.HexColor('#34495e'),
-    spaceAfter=8,
-    spaceBefore=12,
-    fontName='Helvetica-Bold'
-)
-
-body_style = ParagraphStyle(
-    'CustomBody',
-    parent=styles['Normal'],
-    fontSize=11,
-    textColor=colors.HexColor('#333333'),
-    spaceAfter=10,
-    alignment=TA_JUSTIFY,
-    fontName='Helvetica'
-)
-
-bullet_style = ParagraphStyle(
-    'CustomBullet',
-    parent=styles['Normal'],
-    fontSize=10,
-    textColor=colors.HexColor('#333333'),
-    spaceAfter=6,
-    leftIndent=20,
-    fontName='Helvetica'
-)
+# Custom styles: (name, parent, overrides). A parent may be an earlier entry.
+STYLE_SPECS = [
+    ('CustomTitle', 'Heading1', dict(fontSize=28, textColor=C_DARK, spaceAfter=12,
+                                     alignment=TA_CENTER, fontName='Helvetica-Bold')),
+    ('Tagline', 'Normal', dict(fontSize=14, textColor=C_GREY, spaceAfter=20,
+                               alignment=TA_CENTER, fontName='Helvetica')),
+    ('CustomHeading', 'Heading2', dict(fontSize=18, textColor=C_DARK, spaceAfter=12, spaceBefore=16,
+                                       fontName='Helvetica-Bold', leftIndent=10)),
+    # Headings that open a section with extra room before their content
+    ('CustomSectionHeading', 'CustomHeading', dict(spaceAfter=12 + 3*mm)),
+    ('CustomSubHeading', 'Heading3', dict(fontSize=14, textColor=C_SLATE, spaceAfter=8, spaceBefore=12,
+                                          fontName='Helvetica-Bold')),
+    ('CustomBody', 'Normal', dict(fontSize=11, textColor=C_BODY, spaceAfter=10,
+                                  alignment=TA_JUSTIFY, fontName='Helvetica')),
+    ('CustomBullet', 'Normal', dict(fontSize=10, textColor=C_BODY, spaceAfter=6,
+                                    leftIndent=20, fontName='Helvetica')),
+    # A run of bullets laid out as one Paragraph; the leading keeps the old per-line spaceAfter pitch
+    ('CustomBulletBlock', 'CustomBullet', dict(leading=18)),
+    ('CustomCell', 'Normal', dict(fontSize=10, textColor=C_BODY, fontName='Helvetica')),
+    ('Footer', 'Normal', dict(fontSize=12, textColor=C_DARK,
+                              alignment=TA_CENTER, fontName='Helvetica-Bold')),
+]
+
+STYLES = {}
+for name, parent, overrides in STYLE_SPECS:
+    parent_style = STYLES[parent] if parent in STYLES else styles[parent]
+    STYLES[name] = ParagraphStyle(name, parent=parent_style, **overrides)
+
+title_style = STYLES['CustomTitle']
+tagline_style = STYLES['Tagline']
+heading_style = STYLES['CustomHeading']
+section_heading_style = STYLES['CustomSectionHeading']
+subheading_style = STYLES['CustomSubHeading']
+body_style = STYLES['CustomBody']
+bullet_style = STYLES['CustomBullet']
+bullet_block_style = STYLES['CustomBulletBlock']
+cell_style = STYLES['CustomCell']
+footer_style = STYLES['Footer']
+
+def bullets(lines):
+    return P("<br/>".join("• " + line for line in lines), bullet_block_style)
+
+class CellParagraph(Paragraph):
+    # Table wraps every cell once while sizing rows and again while drawing it, at the
+    # same column width; a Paragraph's line breaks depend only on that width, so reuse them.
+    _wrapped = None
+
+    def wrap(self, availWidth, availHeight):
+        if self._wrapped is None or self._wrapped[0] != availWidth:
+            self._wrapped = (availWidth, Paragraph.wrap(self, availWidth, availHeight))
+        return self._wrapped[1]
+
+# Table cells with markup are parsed up front so both Table sizing passes reuse the same frags
+def cells(rows, style=cell_style):
+    return [[CellParagraph(text, style) for text in row] for row in rows]
+
+# Table styles, built once and shared by the tables below
+LINE_TS = TableStyle([
+    ('LINEABOVE', (0,0), (-1,0), 2, C_BLUE),
+])
+
+BENEFITS_TS = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), C_BG),
+    ('TEXTCOLOR', (0, 0), (-1, -1), C_BODY),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, C_LINE),
+])
+
+PAIN_TS = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), C_WHITE),
+    ('TEXTCOLOR', (0, 0), (-1, -1), C_BODY),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('ROWBACKGROUNDS', (0, 0), (-1, -1), [C_WHITE, C_BG]),
+    ('GRID', (0, 0), (-1, -1), 0.5, C_LINE),
+])
+
+WORKFLOW_TS = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), C_BLUE),
+    ('BACKGROUND', (1, 0), (1, -1), C_BG),
+    ('TEXTCOLOR', (0, 0), (0, -1), C_WHITE),
+    ('TEXTCOLOR', (1, 0), (1, -1), C_BODY),
+    ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (0, -1), 14),
+    ('FONTSIZE', (1, 0), (1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, C_WHITE),
+])
+
+COMPARISON_TS = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), C_DARK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), C_WHITE),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [C_WHITE, C_BG]),
+    ('GRID', (0, 0), (-1, -1), 0.5, C_BORDER),
+])
+
+PRICING_TS = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), C_BLUE),
+    ('BACKGROUND', (1, 0), (1, -1), C_WHITE),
+    ('TEXTCOLOR', (0, 0), (0, -1), C_WHITE),
+    ('TEXTCOLOR', (1, 0), (1, -1), C_BODY),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, C_BORDER),
+])
+
+CONTACT_TS = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), C_BG),
+    ('TEXTCOLOR', (0, 0), (-1, -1), C_BODY),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, C_LINE),
+])
 
 # Title Page
 elements.append(Spacer(1, 30*mm))
-elements.append(Paragraph("WhatsApp Order Automation", title_style))
-elements.append(Paragraph("for Bakeries", title_style))
+elements.append(P("WhatsApp Order Automation", title_style))
+elements.append(P("for Bakeries", title_style))
 elements.append(Spacer(1, 10*mm))
-elements.append(Paragraph("Increase repeat orders. Reduce manual work. Simplify customer communication.", tagline_style))
+elements.append(P("Increase repeat orders. Reduce manual work. Simplify customer communication.", tagline_style))
 elements.append(Spacer(1, 20*mm))
 
 # Horizontal line
-line_table = Table([['']], colWidths=[170*mm])
-line_table.setStyle(TableStyle([
-    ('LINEABOVE', (0,0), (-1,0), 2, colors.HexColor('#3498db')),
-]))
+# The next heading's spaceBefore is folded in: Frame subtracts spaceAfter from it
+line_table = Table([['']], colWidths=[170*mm], spaceAfter=10*mm + heading_style.spaceBefore)
+line_table.setStyle(LINE_TS)
 elements.append(line_table)
-elements.append(Spacer(1, 10*mm))
 
 # Business Overview
-elements.append(Paragraph("Business Overview", heading_style))
-elements.append(Paragraph("I build automation tools for local businesses, currently focused on bakeries.", body_style))
-elements.append(Paragraph("<b>My Goal:</b> Help bakery owners increase repeat orders, reduce manual work, and simplify customer communication through intelligent automation.", body_style))
-elements.append(Paragraph("The system is already built and deployed on Google Cloud Run. It's ready to use.", body_style))
+elements.append(P("Business Overview", heading_style))
+elements.append(P("I build automation tools for local businesses, currently focused on bakeries.", body_style))
+elements.append(P("<b>My Goal:</b> Help bakery owners increase repeat orders, reduce manual work, and simplify customer communication through intelligent automation.", body_style))
+elements.append(P("The system is already built and deployed on Google Cloud Run. It's ready to use.", body_style))
 elements.append(Spacer(1, 8*mm))
 
 # What Is This Product
-elements.append(Paragraph("What Is This Product?", heading_style))
-elements.append(Paragraph("A WhatsApp-based order automation system that handles customer orders, manages pre-orders, sends reminders, and provides a business dashboard—all without requiring bakery owners to manage any technology.", body_style))
-elements.append(Paragraph("Your customers text your bakery's WhatsApp number. The system handles everything else.", body_style))
+elements.append(P("What Is This Product?", heading_style))
+elements.append(P("A WhatsApp-based order automation system that handles customer orders, manages pre-orders, sends reminders, and provides a business dashboard—all without requiring bakery owners to manage any technology.", body_style))
+elements.append(P("Your customers text your bakery's WhatsApp number. The system handles everything else.", body_style))
 elements.append(Spacer(1, 8*mm))
 
 # Page Break
 elements.append(PageBreak())
 
 # Core Features
-elements.append(Paragraph("Core Features", heading_style))
+# Followed by a subheading (spaceBefore=12), so keep the Spacer rather than the section style
+elements.append(P("Core Features", heading_style))
 elements.append(Spacer(1, 3*mm))
 
-elements.append(Paragraph("Order Management", subheading_style))
-elements.append(Paragraph("• WhatsApp-based ordering system", bullet_style))
-elements.append(Paragraph("• Custom cake ordering with detail capture", bullet_style))
-elements.append(Paragraph("• Pre-order system with automatic date and time extraction", bullet_style))
-elements.append(Paragraph("• Order history tracking", bullet_style))
-elements.append(Paragraph("• Payment confirmation (manual or automatic)", bullet_style))
+elements.append(P("Order Management", subheading_style))
+elements.append(bullets([
+    "WhatsApp-based ordering system",
+    "Custom cake ordering with detail capture",
+    "Pre-order system with automatic date and time extraction",
+    "Order history tracking",
+    "Payment confirmation (manual or automatic)",
+]))
 elements.append(Spacer(1, 3*mm))
 
-elements.append(Paragraph("Communication Tools", subheading_style))
-elements.append(Paragraph("• Customer chat interface (two-way communication)", bullet_style))
-elements.append(Paragraph("• Automatic reminders for pickup/delivery", bullet_style))
-elements.append(Paragraph("• Repeat order nudges to increase sales", bullet_style))
-elements.append(Paragraph("• Quick-reply templates for common questions", bullet_style))
+elements.append(P("Communication Tools", subheading_style))
+elements.append(bullets([
+    "Customer chat interface (two-way communication)",
+    "Automatic reminders for pickup/delivery",
+    "Repeat order nudges to increase sales",
+    "Quick-reply templates for common questions",
+]))
 elements.append(Spacer(1, 3*mm))
 
-elements.append(Paragraph("Business Dashboard", subheading_style))
-elements.append(Paragraph("• View all orders in one place", bullet_style))
-elements.append(Paragraph("• Track order status", bullet_style))
-elements.append(Paragraph("• Monitor customer interactions", bullet_style))
-elements.append(Paragraph("• Access complete order history", bullet_style))
+elements.append(P("Business Dashboard", subheading_style))
+elements.append(bullets([
+    "View all orders in one place",
+    "Track order status",
+    "Monitor customer interactions",
+    "Access complete order history",
+]))
 elements.append(Spacer(1, 3*mm))
 
-elements.append(Paragraph("Scalability", subheading_style))
-elements.append(Paragraph("• Multi-branch support for bakery chains", bullet_style))
-elements.append(Paragraph("• Fast setup (ready in days, not weeks)", bullet_style))
-elements.append(Paragraph("• Simple verification process", bullet_style))
-elements.append(Paragraph("• End-to-end automation", bullet_style))
+elements.append(P("Scalability", subheading_style))
+elements.append(bullets([
+    "Multi-branch support for bakery chains",
+    "Fast setup (ready in days, not weeks)",
+    "Simple verification process",
+    "End-to-end automation",
+]))
 elements.append(Spacer(1, 8*mm))
 
 # Benefits
-elements.append(Paragraph("Benefits for Bakery Owners", heading_style))
-elements.append(Spacer(1, 3*mm))
+elements.append(P("Benefits for Bakery Owners", section_heading_style))
 
 benefits_data = [
     ["<b>More Repeat Orders</b>", "Automated nudges remind customers to reorder their favorites."],
@@ -157,29 +314,15 @@ benefits_data = [
     ["<b>Convert App Orders to Direct</b>", "Turn Zomato/Swiggy customers into WhatsApp customers—no commission fees."],
 ]
 
-benefits_table = Table(benefits_data, colWidths=[55*mm, 115*mm])
-benefits_table.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#333333')),
-    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-    ('FONTSIZE', (0, 0), (-1, -1), 10),
-    ('LEFTPADDING', (0, 0), (-1, -1), 8),
-    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-    ('TOPPADDING', (0, 0), (-1, -1), 8),
-    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#ecf0f1')),
-]))
+benefits_table = Table(cells(benefits_data), colWidths=[55*mm, 115*mm], spaceAfter=8*mm)
+benefits_table.setStyle(BENEFITS_TS)
 elements.append(benefits_table)
-elements.append(Spacer(1, 8*mm))
 
 # Page Break
 elements.append(PageBreak())
 
 # Pain Points
-elements.append(Paragraph("Pain Points This Solves", heading_style))
-elements.append(Spacer(1, 3*mm))
+elements.append(P("Pain Points This Solves", section_heading_style))
 
 pain_points = [
     ["<b>Problem:</b> Too many order calls during peak hours.", "<b>Solution:</b> WhatsApp automation handles orders without phone calls."],
@@ -190,27 +333,12 @@ pain_points = [
     ["<b>Problem:</b> Complex software systems are too hard to learn.", "<b>Solution:</b> Simple WhatsApp interface—no app installation needed."],
 ]
 
-pain_table = Table(pain_points, colWidths=[85*mm, 85*mm])
-pain_table.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#333333')),
-    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-    ('FONTSIZE', (0, 0), (-1, -1), 10),
-    ('LEFTPADDING', (0, 0), (-1, -1), 10),
-    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-    ('TOPPADDING', (0, 0), (-1, -1), 10),
-    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-    ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#ecf0f1')),
-]))
+pain_table = Table(cells(pain_points), colWidths=[85*mm, 85*mm], spaceAfter=8*mm + heading_style.spaceBefore)
+pain_table.setStyle(PAIN_TS)
 elements.append(pain_table)
-elements.append(Spacer(1, 8*mm))
 
 # How It Works
-elements.append(Paragraph("How It Works", heading_style))
-elements.append(Spacer(1, 3*mm))
+elements.append(P("How It Works", section_heading_style))
 
 workflow_data = [
     ["1", "Customer texts your bakery on WhatsApp"],
@@ -221,34 +349,15 @@ workflow_data = [
     ["6", "Order completed—customer gets nudged for repeat orders"],
 ]
 
-workflow_table = Table(workflow_data, colWidths=[15*mm, 155*mm])
-workflow_table.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#3498db')),
-    ('BACKGROUND', (1, 0), (1, -1), colors.HexColor('#f8f9fa')),
-    ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
-    ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#333333')),
-    ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-    ('FONTSIZE', (0, 0), (0, -1), 14),
-    ('FONTSIZE', (1, 0), (1, -1), 10),
-    ('LEFTPADDING', (0, 0), (-1, -1), 10),
-    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-    ('TOPPADDING', (0, 0), (-1, -1), 10),
-    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-    ('GRID', (0, 0), (-1, -1), 1, colors.white),
-]))
+workflow_table = Table(workflow_data, colWidths=[15*mm, 155*mm], spaceAfter=8*mm)
+workflow_table.setStyle(WORKFLOW_TS)
 elements.append(workflow_table)
-elements.append(Spacer(1, 8*mm))
 
 # Page Break
 elements.append(PageBreak())
 
 # Before vs After
-elements.append(Paragraph("Before vs After Automation", heading_style))
-elements.append(Spacer(1, 3*mm))
+elements.append(P("Before vs After Automation", section_heading_style))
 
 comparison_data = [
     ["Before Automation", "After Automation"],
@@ -261,29 +370,12 @@ comparison_data = [
     ["Missed pre-orders", "Never miss a pre-order again"],
 ]
 
-comparison_table = Table(comparison_data, colWidths=[85*mm, 85*mm])
-comparison_table.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-    ('FONTSIZE', (0, 0), (-1, 0), 12),
-    ('FONTSIZE', (0, 1), (-1, -1), 10),
-    ('LEFTPADDING', (0, 0), (-1, -1), 10),
-    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-    ('TOPPADDING', (0, 0), (-1, -1), 8),
-    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#bdc3c7')),
-]))
+comparison_table = Table(comparison_data, colWidths=[85*mm, 85*mm], spaceAfter=8*mm + heading_style.spaceBefore)
+comparison_table.setStyle(COMPARISON_TS)
 elements.append(comparison_table)
-elements.append(Spacer(1, 8*mm))
 
 # Pricing
-elements.append(Paragraph("Pricing", heading_style))
-elements.append(Spacer(1, 3*mm))
+elements.append(P("Pricing", section_heading_style))
 
 pricing_data = [
     ["Free Trial", "7–14 days, full access, no credit card required"],
@@ -291,52 +383,39 @@ pricing_data = [
     ["After First Month", "₹999/month"],
 ]
 
-pricing_table = Table(pricing_data, colWidths=[60*mm, 110*mm])
-pricing_table.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#3498db')),
-    ('BACKGROUND', (1, 0), (1, -1), colors.white),
-    ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
-    ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#333333')),
-    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-    ('FONTSIZE', (0, 0), (-1, -1), 11),
-    ('LEFTPADDING', (0, 0), (-1, -1), 10),
-    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-    ('TOPPADDING', (0, 0), (-1, -1), 10),
-    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bdc3c7')),
-]))
+pricing_table = Table(pricing_data, colWidths=[60*mm, 110*mm], spaceAfter=5*mm)
+pricing_table.setStyle(PRICING_TS)
 elements.append(pricing_table)
-elements.append(Spacer(1, 5*mm))
-
-elements.append(Paragraph("<b>What You Get:</b>", body_style))
-elements.append(Paragraph("• Full system access", bullet_style))
-elements.append(Paragraph("• Unlimited orders", bullet_style))
-elements.append(Paragraph("• Dashboard access", bullet_style))
-elements.append(Paragraph("• Automatic updates", bullet_style))
-elements.append(Paragraph("• Customer support", bullet_style))
+
+elements.append(P("<b>What You Get:</b>", body_style))
+elements.append(bullets([
+    "Full system access",
+    "Unlimited orders",
+    "Dashboard access",
+    "Automatic updates",
+    "Customer support",
+]))
 elements.append(Spacer(1, 3*mm))
-elements.append(Paragraph("<b>No Hidden Costs. No Setup Fees. Cancel Anytime.</b>", body_style))
+elements.append(P("<b>No Hidden Costs. No Setup Fees. Cancel Anytime.</b>", body_style))
 elements.append(Spacer(1, 8*mm))
 
 # Who Am I
-elements.append(Paragraph("Who Am I?", heading_style))
-elements.append(Paragraph("I'm a teen founder and diploma student who builds automation products for local businesses.", body_style))
+elements.append(P("Who Am I?", heading_style))
+elements.append(P("I'm a teen founder and diploma student who builds automation products for local businesses.", body_style))
 elements.append(Spacer(1, 3*mm))
-elements.append(Paragraph("<b>Why Trust Me?</b>", body_style))
-elements.append(Paragraph("• The system is already fully built and deployed", bullet_style))
-elements.append(Paragraph("• Fast at development and problem-solving", bullet_style))
-elements.append(Paragraph("• Serious about long-term product building", bullet_style))
-elements.append(Paragraph("• Focused on creating real value for small businesses", bullet_style))
+elements.append(P("<b>Why Trust Me?</b>", body_style))
+elements.append(bullets([
+    "The system is already fully built and deployed",
+    "Fast at development and problem-solving",
+    "Serious about long-term product building",
+    "Focused on creating real value for small businesses",
+]))
 elements.append(Spacer(1, 3*mm))
-elements.append(Paragraph("This isn't a side project. This is a professional product built to help bakeries grow.", body_style))
+elements.append(P("This isn't a side project. This is a professional product built to help bakeries grow.", body_style))
 elements.append(Spacer(1, 8*mm))
 
 # Contact Section
-elements.append(Paragraph("Get Started Today", heading_style))
-elements.append(Spacer(1, 3*mm))
+elements.append(P("Get Started Today", section_heading_style))
 
 contact_data = [
     ["WhatsApp", "[Your WhatsApp Number]"],
@@ -345,37 +424,17 @@ contact_data = [
     ["Website", "[Your Website/Domain]"],
 ]
 
-contact_table = Table(contact_data, colWidths=[40*mm, 130*mm])
-contact_table.setStyle(TableStyle([
-    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f8f9fa')),
-    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#333333')),
-    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-    ('FONTSIZE', (0, 0), (-1, -1), 11),
-    ('LEFTPADDING', (0, 0), (-1, -1), 10),
-    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-    ('TOPPADDING', (0, 0), (-1, -1), 8),
-    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#ecf0f1')),
-]))
+contact_table = Table(contact_data, colWidths=[40*mm, 130*mm], spaceAfter=10*mm)
+contact_table.setStyle(CONTACT_TS)
 elements.append(contact_table)
-elements.append(Spacer(1, 10*mm))
 
 # Footer
-footer_style = ParagraphStyle(
-    'Footer',
-    parent=styles['Normal'],
-    fontSize=12,
-    textColor=colors.HexColor('#2c3e50'),
-    alignment=TA_CENTER,
-    fontName='Helvetica-Bold'
-)
-elements.append(Paragraph("Ready to Automate Your Bakery?", footer_style))
+elements.append(P("Ready to Automate Your Bakery?", footer_style))
 elements.append(Spacer(1, 2*mm))
-elements.append(Paragraph("Contact me for a free trial and see the difference automation makes.", body_style))
+elements.append(P("Contact me for a free trial and see the difference automation makes.", body_style))
 
 # Build PDF
 pdf.build(elements)
-print("PDF created successfully: bakery_automation_brochure.pdf")
\ No newline at end of file
+with open(HASH_PATH, "w") as f:
+    f.write(source_hash)
+print(f"PDF created successfully: {OUTPUT_PATH}")
\ No newline at end of file
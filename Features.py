@@ -1,18 +1,94 @@
 import re
+import hashlib
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from threading import Lock, local
+import requests
 from deep_translator import GoogleTranslator
+from deep_translator import google as _google_translator_module
 from functools import lru_cache
+from typing import Tuple, Union
 from encryption_utils import get_logger, sanitize_input
+from firebase import get_cached_translation, save_cached_translation
 
 logger = get_logger()
 
-# Cache for translations to avoid repeated API calls
-@lru_cache(maxsize=500)
+# GoogleTranslator keeps per-request state on the instance, so instances are
+# reused per language pair within a thread rather than shared across threads
+_translator_local = local()
+
+
+def _get_translator(source_lang: str, target_lang: str) -> GoogleTranslator:
+    """Return this thread's GoogleTranslator for the language pair, creating it once."""
+    translators = getattr(_translator_local, "translators", None)
+    if translators is None:
+        translators = _translator_local.translators = {}
+    translator = translators.get((source_lang, target_lang))
+    if translator is None:
+        translator = translators[(source_lang, target_lang)] = GoogleTranslator(source=source_lang, target=target_lang)
+    return translator
+
+# Translation calls run on worker threads so the timeout works off the main thread
+# (SIGALRM only fires in the main thread and serialized every translation)
+TRANSLATE_TIMEOUT_SECONDS = 10
+
+
+class _TimeoutRequests:
+    """Stands in for `requests` inside deep_translator.google, which calls requests.get without a timeout."""
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    @staticmethod
+    def get(*args, **kwargs):
+        kwargs.setdefault("timeout", TRANSLATE_TIMEOUT_SECONDS)
+        return requests.get(*args, **kwargs)
+
+
+# A worker thread can't be interrupted, so a Google call that never answers would
+# hold its pool slot for good; the socket timeout is what bounds each call
+_google_translator_module.requests = _TimeoutRequests()
+_TRANSLATE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="translate")
+
+
+def translate_with_timeout(text: str, source_lang: str, target_lang: str,
+                           timeout: float = TRANSLATE_TIMEOUT_SECONDS) -> str:
+    """Translate via Google, raising TimeoutError if no reply within `timeout` seconds."""
+    future = _TRANSLATE_POOL.submit(lambda: _get_translator(source_lang, target_lang).translate(text))
+    try:
+        return future.result(timeout=timeout)
+    except (FutureTimeoutError, requests.Timeout):
+        # On a wait timeout the call keeps running; the socket timeout frees its worker
+        raise TimeoutError("Translation timeout")
+
+
+# Cache for translations to avoid repeated API calls. Keys hold a 16-byte digest
+# of the text instead of the text itself, so long inputs don't pin memory.
+CACHED_TRANSLATE_SIZE = 500
+_cached_translations = OrderedDict()
+_cached_translations_lock = Lock()
+
+
 def cached_translate(text: str, source_lang: str, target_lang: str) -> str:
     """Cache translations to improve speed."""
+    key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), source_lang, target_lang)
+    with _cached_translations_lock:
+        translated = _cached_translations.get(key)
+        if translated is not None:
+            _cached_translations.move_to_end(key)
+            return translated
+    
     try:
-        return GoogleTranslator(source=source_lang, target=target_lang).translate(text)
+        translated = _get_translator(source_lang, target_lang).translate(text)
     except Exception as e:
-        return text  # Return original on failure
+        return text  # Return original on failure (not cached)
+    
+    with _cached_translations_lock:
+        _cached_translations[key] = translated
+        if len(_cached_translations) > CACHED_TRANSLATE_SIZE:
+            _cached_translations.popitem(last=False)
+    return translated
+
 
 
 class EfficientTranslator:
@@ -30,14 +106,46 @@ class EfficientTranslator:
         'hinglish': 'en'  # Treat Hinglish as Hindi for translation
     }
     
-    # Script patterns for accurate detection (pre-compiled for speed)
-    HINDI_PATTERN = re.compile(r'[\u0900-\u097F]+')
-    GUJARATI_PATTERN = re.compile(r'[\u0A80-\u0AFF]+')
-    LATIN_PATTERN = re.compile(r'[A-Za-z]+')
-    DIGIT_PATTERN = re.compile(r'\d+')
+    # Caller-supplied language names/codes -> canonical names returned by detect_language
+    LANG_NAMES = {
+        'english': 'English', 'en': 'English',
+        'hindi': 'Hindi', 'hi': 'Hindi',
+        'gujarati': 'Gujarati', 'gu': 'Gujarati',
+        'hinglish': 'Hinglish',
+    }
+    
+    # Script codepoint ranges for accurate detection (inclusive)
+    HINDI_RANGE = (0x0900, 0x097F)
+    GUJARATI_RANGE = (0x0A80, 0x0AFF)
+    
+    # Characters ignored when measuring script ratios (besides digits and whitespace)
+    SKIP_CHARS = frozenset('.,!?;:-\'"()[]{}')
+    
+    # Sentence boundaries for batched back-translation (separator whitespace is captured)
+    SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])(\s+)')
+    BATCH_SEPARATOR = "\n\n"
+    
+    # Maximum number of translations kept; least recently used entries are evicted
+    TRANSLATION_CACHE_SIZE = 1000
+    
+    # Texts up to this length are memoized by detect_language
+    DETECT_CACHE_MAX_LENGTH = 256
+    
+    # Word tokenizer for Hinglish detection (pre-compiled for speed)
+    WORD_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
+    
+    # Repeated characters (yaaar, heyyy, okkk), matched against lowercased text
+    REPEATED_CHAR_PATTERN = re.compile(r'([a-z])\1{2,}')
+    
+    # Common Hinglish sentence patterns, fused into one alternation
+    HINGLISH_SENTENCE_PATTERN = re.compile(
+        r'\b(kya|kyun|kaise)\b.*\?'  # Question words
+        r'|\bhai\b.*\b(kya|yaar|bhai)\b'  # Common combinations
+        r'|\b(mein|main|hum)\b.*\b(kar|ho|hai)\b'  # Subject-verb patterns
+    )
     
     # Common Hinglish words (expanded list for better detection)
-    HINGLISH_INDICATORS = {
+    HINGLISH_INDICATORS = frozenset({
         # Common Hindi words in Roman script
         'hai', 'h', 'ho', 'hoon', 'hain', 'hu', 'hun',
         'kya', 'kyun', 'kyu', 'kaise', 'kaisa', 'kese', 'kesa',
@@ -94,10 +202,10 @@ class EfficientTranslator:
         'shayad', 'sayad', 'shayd',
         'zaroor', 'jarur', 'zarur',
         'matlab', 'mtlb', 'yaani', 'yani',
-    }
+    })
     
     # Common English words (to distinguish from Hinglish)
-    COMMON_ENGLISH = {
+    COMMON_ENGLISH = frozenset({
         'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
         'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
         'should', 'could', 'can', 'may', 'might', 'must',
@@ -110,30 +218,86 @@ class EfficientTranslator:
         'i', 'you', 'he', 'she', 'it', 'we', 'they',
         'my', 'your', 'his', 'her', 'its', 'our', 'their',
         'me', 'him', 'us', 'them'
-    }
+    })
     
     def __init__(self):
         """Initialize translator with cache."""
-        self.translation_cache = {}
+        self.translation_cache = OrderedDict()
+        self._cache_lock = Lock()
+    
+    @staticmethod
+    def _make_cache_key(direction: str, text: str, lang: str) -> str:
+        """Compact cache key; the text is hashed so long responses aren't kept twice."""
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{direction}_{digest}_{lang}"
+    
+    def _cache_get(self, key: str, persistent: bool = False):
+        """
+        Return a cached translation (marking it recently used) or None.
         
-    def _calculate_script_ratio(self, text: str) -> dict:
-        """Calculate the ratio of different scripts in text."""
-        # Remove digits and punctuation for analysis
+        With persistent=True a local miss falls back to the Firestore cache,
+        so translations survive restarts and are shared between instances.
+        """
+        with self._cache_lock:
+            value = self.translation_cache.get(key)
+            if value is not None:
+                self.translation_cache.move_to_end(key)
+                return value
+        
+        if persistent:
+            value = get_cached_translation(key)
+            if value is not None:
+                self._cache_put(key, value)
+        return value
+    
+    def _cache_put(self, key: str, value: Union[str, Tuple[str, str]], persistent: bool = False):
+        """
+        Cache a translation, evicting the least recently used entry when full.
+        Raw-text entries ("to_en_raw_*") hold a (translation, source_language) tuple.
+        """
+        with self._cache_lock:
+            self.translation_cache[key] = value
+            self.translation_cache.move_to_end(key)
+            if len(self.translation_cache) > self.TRANSLATION_CACHE_SIZE:
+                self.translation_cache.popitem(last=False)
+        
+        if persistent and value:
+            save_cached_translation(key, value)
+        
+    @classmethod
+    def _calculate_script_ratio(cls, text: str, stop_at_hindi: float = None) -> dict:
+        """
+        Calculate the ratio of different scripts in text.
+        
+        If stop_at_hindi is given, scanning stops as soon as the Hindi ratio is
+        certain to exceed it (Hindi count > stop_at_hindi * len(text)); the
+        returned Hindi ratio is then above the threshold and the others are partial.
+        """
+        # Single pass: skip digits, whitespace and punctuation, count the rest by script
         try:
-            text_clean = re.sub(r'[\d\s\.,!?;:\-\'\"()\[\]{}]+', '', text)
-            total_chars = len(text_clean)
+            hindi_lo, hindi_hi = cls.HINDI_RANGE
+            gujarati_lo, gujarati_hi = cls.GUJARATI_RANGE
+            skip_chars = cls.SKIP_CHARS
+            hindi_limit = stop_at_hindi * len(text) if stop_at_hindi is not None else None
+            hindi_chars = gujarati_chars = latin_chars = total_chars = 0
+            
+            for ch in text:
+                if ch.isspace() or ch.isdecimal() or ch in skip_chars:
+                    continue
+                total_chars += 1
+                cp = ord(ch)
+                if hindi_lo <= cp <= hindi_hi:
+                    hindi_chars += 1
+                    if hindi_limit is not None and hindi_chars > hindi_limit:
+                        break
+                elif gujarati_lo <= cp <= gujarati_hi:
+                    gujarati_chars += 1
+                elif 97 <= cp <= 122 or 65 <= cp <= 90:
+                    latin_chars += 1
             
             if total_chars == 0:
                 return {'hindi': 0, 'gujarati': 0, 'latin': 0}
             
-            hindi_matches = self.HINDI_PATTERN.findall(text_clean)
-            gujarati_matches = self.GUJARATI_PATTERN.findall(text_clean)
-            latin_matches = self.LATIN_PATTERN.findall(text_clean)
-            
-            hindi_chars = sum(len(match) for match in hindi_matches)
-            gujarati_chars = sum(len(match) for match in gujarati_matches)
-            latin_chars = sum(len(match) for match in latin_matches)
-            
             return {
                 'hindi': hindi_chars / total_chars if total_chars > 0 else 0,
                 'gujarati': gujarati_chars / total_chars if total_chars > 0 else 0,
@@ -142,7 +306,8 @@ class EfficientTranslator:
         except Exception as e:
             logger.log_error("_calculate_script_ratio. Features.py", e)
     
-    def _is_hinglish(self, text: str) -> bool:
+    @classmethod
+    def _is_hinglish(cls, text: str) -> bool:
         """
         Detect if text is Hinglish using multiple heuristics.
         
@@ -154,32 +319,29 @@ class EfficientTranslator:
         """
         try:
             # Extract words and normalize
-            words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+            text_lower = text.lower()
+            words = cls.WORD_PATTERN.findall(text_lower)
             if not words or len(words) < 2:
                 return False
             
-            # Count Hinglish indicator words
-            hinglish_count = sum(1 for word in words if word in self.HINGLISH_INDICATORS)
-            english_count = sum(1 for word in words if word in self.COMMON_ENGLISH)
+            # Count Hinglish indicator words (set intersection runs in C)
+            word_counts = Counter(words)
+            hinglish_count = sum(word_counts[w] for w in word_counts.keys() & cls.HINGLISH_INDICATORS)
+            english_count = sum(word_counts[w] for w in word_counts.keys() & cls.COMMON_ENGLISH)
             
             hinglish_ratio = hinglish_count / len(words)
             english_ratio = english_count / len(words)
             
             # Advanced patterns for Hinglish
             # 1. Repeated characters (yaaar, heyyy, okkk)
-            has_repeated_chars = bool(re.search(r'([a-z])\1{2,}', text.lower()))
+            has_repeated_chars = bool(cls.REPEATED_CHAR_PATTERN.search(text_lower))
             
             # 2. Mix of Hindi transliterations and English
             # If has both Hinglish words and English words, likely Hinglish
             has_both = hinglish_count > 0 and english_count > 0
             
             # 3. Common Hinglish sentence patterns
-            hinglish_patterns = [
-                r'\b(kya|kyun|kaise)\b.*\?',  # Question words
-                r'\bhai\b.*\b(kya|yaar|bhai)\b',  # Common combinations
-                r'\b(mein|main|hum)\b.*\b(kar|ho|hai)\b',  # Subject-verb patterns
-            ]
-            has_pattern = any(re.search(pattern, text.lower()) for pattern in hinglish_patterns)
+            has_pattern = bool(cls.HINGLISH_SENTENCE_PATTERN.search(text_lower))
             
             # Decision logic:
             # Strong Hinglish indicators
@@ -203,6 +365,13 @@ class EfficientTranslator:
         except Exception as e:
             logger.log_error("_is_hinglish. Features.py", e)
         
+    @classmethod
+    def _is_plain_english(cls, text: str) -> bool:
+        """True if text is ASCII and contains no Hinglish indicator words."""
+        if not text.isascii():
+            return False
+        return cls.HINGLISH_INDICATORS.isdisjoint(cls.WORD_PATTERN.findall(text.lower()))
+    
     def detect_language(self, text: str) -> str:
         """
         Detect language with high accuracy using pure regex approach.
@@ -214,45 +383,61 @@ class EfficientTranslator:
             Language name: 'English', 'Hindi', 'Gujarati', or 'Hinglish'
         """
         try:
-            if not text or not text.strip():
-                return "English"
-            
-            text_clean = text.strip()
-            
-            # Step 1: Script-based detection (fastest and most reliable)
-            script_ratios = self._calculate_script_ratio(text_clean)
-            
-            # If primarily Hindi script (>30% Hindi characters)
-            if script_ratios['hindi'] > 0.3:
-                return "Hindi"
-            
-            # If primarily Gujarati script (>30% Gujarati characters)
-            if script_ratios['gujarati'] > 0.3:
-                return "Gujarati"
-            
-            # If mixed scripts with some Hindi/Gujarati (5-30%)
-            if 0.05 < script_ratios['hindi'] < 0.3:
-                return "Hindi"  # Treat as Hindi
-            if 0.05 < script_ratios['gujarati'] < 0.3:
-                return "Gujarati"
-            
-            # Step 2: Latin script - distinguish between English and Hinglish
-            if script_ratios['latin'] > 0.5 or (script_ratios['hindi'] == 0 and script_ratios['gujarati'] == 0):
-                if self._is_hinglish(text_clean):
-                    return "Hinglish"
+            text_clean = text.strip() if text else ""
+            if not text_clean:
                 return "English"
             
-            # Default to English for unknown cases
-            return "English"
+            # Short messages ("ok", "hi", "haan") repeat constantly; long ones would only bloat the cache
+            if len(text_clean) <= self.DETECT_CACHE_MAX_LENGTH:
+                return self._classify_language_cached(text_clean)
+            return self._classify_language(text_clean)
         except Exception as e:
             logger.log_error("detect_launguage. Features.py", e)
     
-    def translate_to_english(self, text: str) -> tuple:
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _classify_language_cached(cls, text_clean: str) -> str:
+        """Memoized _classify_language; detection is a pure function of the text."""
+        return cls._classify_language(text_clean)
+    
+    @classmethod
+    def _classify_language(cls, text_clean: str) -> str:
+        """Classify stripped, non-empty text. Errors propagate to detect_language."""
+        # Step 1: Script-based detection (fastest and most reliable)
+        script_ratios = cls._calculate_script_ratio(text_clean, stop_at_hindi=0.3)
+        
+        # If primarily Hindi script (>30% Hindi characters)
+        if script_ratios['hindi'] > 0.3:
+            return "Hindi"
+        
+        # If primarily Gujarati script (>30% Gujarati characters)
+        if script_ratios['gujarati'] > 0.3:
+            return "Gujarati"
+        
+        # If mixed scripts with some Hindi/Gujarati (5-30%)
+        if 0.05 < script_ratios['hindi'] < 0.3:
+            return "Hindi"  # Treat as Hindi
+        if 0.05 < script_ratios['gujarati'] < 0.3:
+            return "Gujarati"
+        
+        # Step 2: Latin script - distinguish between English and Hinglish
+        if script_ratios['latin'] > 0.5 or (script_ratios['hindi'] == 0 and script_ratios['gujarati'] == 0):
+            if cls._is_hinglish(text_clean):
+                return "Hinglish"
+            return "English"
+        
+        # Default to English for unknown cases
+        return "English"
+    
+    def translate_to_english(self, text: str, source_lang: str = None) -> tuple:
         """
         Translate text to English if needed.
         
         Args:
             text: Input text
+            source_lang: Language already detected for this user/session, as a name
+                or code in any case ('English', 'en', 'HINDI', ...); detected if omitted
+                or unknown
             
         Returns:
             tuple: (translated_text, source_language)
@@ -274,48 +459,83 @@ class EfficientTranslator:
                 # Truncate instead of rejecting
                 text = text[:MAX_TRANSLATE_LENGTH]
 
-            text = sanitize_input(text)
+            # Reuse a caller-supplied language ("english", "EN", "Hindi", ...) only if it's one we know
+            if source_lang is not None:
+                source_lang = self.LANG_NAMES.get(str(source_lang).strip().lower())
+            
+            # Repeated messages skip sanitize/detect/translate. Only texts sanitize_input
+            # left unchanged are stored under the raw key, so its [SECURITY] logging
+            # still runs for every message it had to neutralize.
+            raw_key = self._make_cache_key("to_en_raw", text, source_lang or "auto")
+            cached = self._cache_get(raw_key)
+            if cached is not None:
+                return cached
+            
+            # sanitize_input returns stripped text, so no further strip() is needed below
+            sanitized = sanitize_input(text)
+            cacheable = sanitized == text
+            text = sanitized
 
-            if not text or not text.strip():
+            if not text:
                 return text, "English"
             
-            # Detect source language
-            source_lang = self.detect_language(text)
+            result = self._translate_sanitized_to_english(text, source_lang)
+            if result is None:
+                return None
+            if result[0] is None:
+                return text, result[1]  # translation failed; not cached so it's retried
+            # English pass-through is already cheap; caching it would only evict real translations
+            if cacheable and result[1] != "English":
+                self._cache_put(raw_key, result)
+            return result
+        except Exception as e:
+            logger.log_error("translate_to_english. Features.py", e)
+    
+    def _translate_sanitized_to_english(self, text: str, source_lang: str = None) -> tuple:
+        """
+        translate_to_english for sanitized, non-empty text and a canonical
+        (or None) source_lang.
+        
+        Returns (translated_text, source_language); translated_text is None if
+        the Google call failed, in which case the caller falls back to `text`.
+        """
+        try:
+            if source_lang is None:
+                # Fast path: ASCII text has no Devanagari/Gujarati, and without any
+                # Hinglish indicator word detect_language can only answer English
+                if self._is_plain_english(text):
+                    return text, "English"
+                
+                # Detect source language
+                source_lang = self.detect_language(text)
             
             # Skip translation if already English
             if source_lang == "English":
                 return text, source_lang
             
             # Check cache first
-            cache_key = f"to_en_{text}_{source_lang}"
-            if cache_key in self.translation_cache:
-                return self.translation_cache[cache_key], source_lang
+            cache_key = self._make_cache_key("to_en", text, source_lang)
+            cached = self._cache_get(cache_key, persistent=True)
+            if cached is not None:
+                return cached, source_lang
             
             # Get language code
             lang_code = self.LANG_CODES.get(source_lang.lower(), 'auto')
             
             try:
-                import signal
-                
-                def timeout_handler(signum, frame):
-                    raise TimeoutError("Translation timeout")
-                
-                # Set 10 second timeout
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(10)
                 # Translate to English
-                translated = GoogleTranslator(source=lang_code, target='en').translate(text)
+                translated = translate_with_timeout(text, lang_code, 'en')
                 
                 # Cache the result
-                self.translation_cache[cache_key] = translated
+                self._cache_put(cache_key, translated, persistent=True)
                 
                 return translated, source_lang
                 
             except Exception as e:
                 print(f"Translation to English failed: {e}")
-                return text, source_lang
+                return None, source_lang
         except Exception as e:
-            logger.log_error("translate_to_english. Features.py", e)
+            logger.log_error("_translate_sanitized_to_english. Features.py", e)
     
     def translate_from_english(self, text: str, target_lang: str) -> str:
         """
@@ -345,7 +565,7 @@ class EfficientTranslator:
                     {"target": target_lang}
                 )
                 return text
-            if not text or not text.strip():
+            if not text:
                 return text
             
             # Skip if target is English
@@ -357,35 +577,24 @@ class EfficientTranslator:
                 text = text[:MAX_TRANSLATE_LENGTH]
 
             # Check cache first
-            cache_key = f"from_en_{text}_{target_lang}"
-            if cache_key in self.translation_cache:
-                return self.translation_cache[cache_key]
+            cache_key = self._make_cache_key("from_en", text, target_lang)
+            cached = self._cache_get(cache_key, persistent=True)
+            if cached is not None:
+                return cached
             
             # Get language code
             target_code = self.LANG_CODES.get(target_lang.lower(), 'en')
             
             try:
                 # ✅ SECURITY: Timeout protection
-                import signal
-                
-                def timeout_handler(signum, frame):
-                    raise TimeoutError("Translation timeout")
-                
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(10)
-                
-                try:
-                    translated = GoogleTranslator(source='en', target=target_code).translate(text)
-                finally:
-                    signal.alarm(0)
+                translated = translate_with_timeout(text, 'en', target_code)
                 
                 # ✅ SECURITY: Validate output
                 if not translated or not isinstance(translated, str):
                     return text
                 
-                # Cache with size limit
-                if len(self.translation_cache) < 1000:
-                    self.translation_cache[cache_key] = translated
+                # Cache the result (LRU-bounded, persisted)
+                self._cache_put(cache_key, translated, persistent=True)
                 
                 return translated
                 
@@ -398,19 +607,23 @@ class EfficientTranslator:
         except Exception as e:
             logger.log_error("translate_from_english. features.py", e)
 
-    def process_query(self, text: str) -> tuple:
+    def process_query(self, text: str, source_lang: str = None) -> tuple:
         """
         Complete translation pipeline: detect -> translate to English -> return both.
         
+        This is the single detection site; callers that already know the user's
+        language (e.g. stored on their session) pass it to skip detection.
+        
         Args:
             text: Input text in any supported language
+            source_lang: Previously detected language, if known
             
         Returns:
             tuple: (english_text, source_language, original_text)
         """
         try:
             original_text = text
-            english_text, source_lang = self.translate_to_english(text)
+            english_text, source_lang = self.translate_to_english(text, source_lang=source_lang)
             return english_text, source_lang, original_text
         except Exception as e:
             logger.log_error("process_query. Features.py", e)
@@ -429,25 +642,25 @@ class EfficientTranslator:
         """
         try:
             # Validate input
-            if not english_response or not english_response.strip():
+            english_response = english_response.strip() if english_response else ""
+            if not english_response:
                 return "I'm sorry, I couldn't generate a response."
             
-            english_response = english_response.strip()
-            
             # Skip if target is English
             if target_lang.lower() == "english":
                 return english_response
             
             # Check cache first
-            cache_key = f"from_en_{english_response}_{target_lang}"
-            if cache_key in self.translation_cache:
-                return self.translation_cache[cache_key]
+            cache_key = self._make_cache_key("from_en", english_response, target_lang)
+            cached = self._cache_get(cache_key, persistent=True)
+            if cached is not None:
+                return cached
             
             # Get language code
             target_code = self.LANG_CODES.get(target_lang.lower(), 'en')
             
-            # Translate from English
-            translated = GoogleTranslator(source='en', target=target_code).translate(english_response)
+            # Translate from English, one request for all uncached sentences
+            translated = self._batch_translate(english_response, target_lang, target_code)
             
             # Validate translation didn't truncate
             if not translated or len(translated) < len(english_response) * 0.5:
@@ -459,7 +672,7 @@ class EfficientTranslator:
                 return english_response
             
             # Cache the result
-            self.translation_cache[cache_key] = translated
+            self._cache_put(cache_key, translated, persistent=True)
             
             # Log translation
             logger.log_security_event(
@@ -478,11 +691,62 @@ class EfficientTranslator:
             # Fallback to English on error
             return english_response
     
+    def _batch_translate(self, text: str, target_lang: str, target_code: str) -> str:
+        """
+        Translate English text sentence by sentence so recurring sentences hit the cache.
+        
+        All uncached sentences are joined and sent in a single request, then split
+        back apart. If the reply can't be split cleanly the whole text is translated.
+        
+        Args:
+            text: English text
+            target_lang: Target language name (used in cache keys)
+            target_code: Target language code for the translator
+            
+        Returns:
+            Translated text with the original whitespace between sentences
+        """
+        parts = self.SENTENCE_SPLIT_PATTERN.split(text)
+        sentences, separators = parts[0::2], parts[1::2]
+        
+        translations = {}
+        misses = []
+        for sentence in sentences:
+            if not sentence or sentence in translations or sentence in misses:
+                continue
+            cached = self._cache_get(self._make_cache_key("from_en", sentence, target_lang))
+            if cached is not None:
+                translations[sentence] = cached
+            else:
+                misses.append(sentence)
+        
+        if misses:
+            if any(self.BATCH_SEPARATOR in sentence for sentence in misses):
+                return translate_with_timeout(text, 'en', target_code)
+            
+            batch = translate_with_timeout(self.BATCH_SEPARATOR.join(misses), 'en', target_code)
+            results = batch.split(self.BATCH_SEPARATOR) if batch else []
+            if len(results) != len(misses):
+                return translate_with_timeout(text, 'en', target_code)
+            
+            for sentence, result in zip(misses, results):
+                result = result.strip()
+                translations[sentence] = result
+                self._cache_put(self._make_cache_key("from_en", sentence, target_lang), result)
+        
+        output = []
+        for i, sentence in enumerate(sentences):
+            output.append(translations.get(sentence, sentence))
+            if i < len(separators):
+                output.append(separators[i])
+        return "".join(output)
+    
     def clear_cache(self):
         """Clear translation cache safely."""
         try:
-            cache_size = len(self.translation_cache)
-            self.translation_cache.clear()
+            with self._cache_lock:
+                cache_size = len(self.translation_cache)
+                self.translation_cache.clear()
             logger.log_client_operation(
                 "translation_cache_cleared",
                 "system",
@@ -17,13 +17,25 @@ import os
 import re
 import time
 import json
+import unicodedata
+import asyncio
+import random
+import httpx
 import requests
-from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from pathlib import Path
 from encryption_utils import get_logger, hash_for_logging
 from functools import lru_cache
 import hashlib
 from firebase import db
+from manager import extract_goals_from_FB, extract_name_from_FB
+import orjson
 
 rag_logger = get_logger()
 logger = get_logger()
@@ -33,7 +45,7 @@ try:
     from langchain_text_splitters import RecursiveCharacterTextSplitter
     from langchain_community.vectorstores import FAISS
     from langchain.prompts import ChatPromptTemplate
-    from langchain_core.runnables import RunnableParallel, RunnablePassthrough
+    from langchain_core.runnables import RunnableParallel, RunnablePassthrough, RunnableLambda
     from langchain_core.output_parsers import StrOutputParser
     from langchain_core.documents import Document
     from langchain_community.retrievers import BM25Retriever
@@ -74,16 +86,101 @@ except Exception as e:
 # Optimized chunk settings for better retrieval
 DEFAULT_CHUNK_SIZE = 450
 DEFAULT_CHUNK_OVERLAP = 100
+INDEX_CACHE_SIZE = 32  # documents whose FAISS/BM25 index is kept process-wide
+TRANSLATION_CACHE_SIZE = 4096  # (text, language) pairs whose translation is kept process-wide
+TRANSLATION_CACHE_TTL = 86400  # seconds
+TRANSLATION_BATCH_MAX = 16  # texts packed into one batched translation prompt
+MAX_TRANSLATE_CHARS = 4000  # longer texts are translated in sentence-aligned pieces
 
 DEFAULT_TOP_K = 5
 DEFAULT_TEMPERATURE = 0.4
 DEFAULT_MAX_OUTPUT_TOKENS = 2048
 DEFAULT_MODEL = "gemini-2.5-flash-lite"  # Model name for REST API
 DEFAULT_EMBEDDING_MODEL = "text-embedding-004"
+EMBED_BATCH_SIZE = 100  # Gemini's batchEmbedContents limit
+EMBED_MAX_WORKERS = 8
+CHAT_MAX_WORKERS = 8
+EMBED_QUERY_CACHE_SIZE = 256
+SEMANTIC_CACHE_THRESHOLD = 0.92  # cosine similarity for paraphrase cache hits
+
+# Retry policy for Gemini calls, shared by the requests session and the async client
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_BACKOFF_JITTER = 0.25
+RETRY_BACKOFF_MAX = 10  # seconds
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
 # Gemini REST API endpoints
 GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
 
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with a connection pool and retries for Gemini calls."""
+    session = requests.Session()
+    retry_options = dict(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=list(RETRY_STATUSES),
+        allowed_methods=["POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # hand the last response back so callers keep their status handling
+    )
+    try:
+        # Jitter spreads out retries from concurrent workers (urllib3 >= 2.0)
+        retry = Retry(backoff_jitter=RETRY_BACKOFF_JITTER, **retry_options)
+    except TypeError:
+        retry = Retry(**retry_options)
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry))
+    return session
+
+
+# Shared by every Gemini client so TLS connections are reused across calls
+_SESSION = _build_session()
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_SENTENCE_ENDINGS = ('.', '!', '?', '।', '।।')
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request body to JSON bytes."""
+    return orjson.dumps(payload)
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body; raises ValueError on invalid JSON."""
+    return orjson.loads(content)
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the shared async client, creating it lazily inside the running event loop."""
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT.is_closed:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=60
+        )
+    return _ASYNC_CLIENT
+
+
+async def _apost_with_retry(url: str, content: bytes, timeout: Optional[float] = None) -> httpx.Response:
+    """
+    POST through the shared async client, retrying 429/5xx with jittered exponential
+    backoff (honouring Retry-After) like the requests session does. The last response
+    is returned either way so callers keep their status handling.
+    """
+    client = _get_async_client()
+    kwargs = {"timeout": timeout} if timeout is not None else {}
+    for attempt in range(RETRY_TOTAL + 1):
+        response = await client.post(url, headers=_JSON_HEADERS, content=content, **kwargs)
+        if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+            return response
+        delay = RETRY_BACKOFF_FACTOR * (2 ** attempt) + random.uniform(0, RETRY_BACKOFF_JITTER)
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        await asyncio.sleep(min(delay, RETRY_BACKOFF_MAX))
+    return response
+
 schemas = [
     ResponseSchema(name="status", description="true or false"),
     ResponseSchema(name="reason", description="why it’s false"),
@@ -93,6 +190,26 @@ schemas = [
     ResponseSchema(name="quantity", description="number of items")
 ]
 
+_JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL)
+
+
+class FastStructuredOutputParser(StructuredOutputParser):
+    """StructuredOutputParser that decodes well-formed replies with orjson."""
+
+    def parse(self, text: str) -> Any:
+        body = text.strip()
+        fenced = _JSON_FENCE_RE.match(body)
+        if fenced:
+            body = fenced.group(1)
+        try:
+            result = _loads(body)
+        except ValueError:
+            # Partial or chatty output: let langchain's tolerant parser handle (or reject) it
+            return super().parse(text)
+        if isinstance(result, dict) and all(schema.name in result for schema in self.response_schemas):
+            return result
+        return super().parse(text)
+
 # ============================================================================
 # CUSTOM GEMINI REST API IMPLEMENTATIONS
 # ============================================================================
@@ -100,85 +217,192 @@ schemas = [
 class GeminiRESTEmbeddings(Embeddings):
     """Custom Gemini Embeddings using REST API instead of gRPC."""
     
-    def __init__(self, api_key: str, model: str = DEFAULT_EMBEDDING_MODEL):
+    # Recent query vectors, shared by every instance since bots may reuse another bot's index
+    _query_embeddings: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+    _query_lock = Lock()
+    
+    def __init__(self, api_key: str, model: str = DEFAULT_EMBEDDING_MODEL, session: Optional[requests.Session] = None):
         self.api_key = api_key
         self.model = model
+        self.session = session or _SESSION
         self.endpoint = f"{GEMINI_API_BASE}/models/{model}:embedContent"
         self.batch_endpoint = f"{GEMINI_API_BASE}/models/{model}:batchEmbedContents"
+        self._url = f"{self.endpoint}?key={api_key}"
+        self._batch_url = f"{self.batch_endpoint}?key={api_key}"
+        self._model_path = f"models/{model}"
         
     def _make_request(self, texts: List[str], batch: bool = False) -> List[List[float]]:
         """Make REST API request to Gemini."""
         try:
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
             if batch and len(texts) > 1:
                 # Batch embedding request
                 payload = {
                     "requests": [
                         {
-                            "model": f"models/{self.model}",
+                            "model": self._model_path,
                             "content": {"parts": [{"text": text}]}
                         }
                         for text in texts
                     ]
                 }
-                url = f"{self.batch_endpoint}?key={self.api_key}"
-                
-                response = requests.post(url, headers=headers, json=payload, timeout=30)
+                response = self.session.post(self._batch_url, headers=_JSON_HEADERS, data=_dumps(payload), timeout=30)
                 response.raise_for_status()
                 
-                result = response.json()
+                result = _loads(response.content)
                 return [emb["values"] for emb in result.get("embeddings", [])]
             else:
                 # Single embedding requests
                 embeddings = []
-                url = f"{self.endpoint}?key={self.api_key}"
                 
                 for text in texts:
                     payload = {
-                        "model": f"models/{self.model}",
+                        "model": self._model_path,
                         "content": {"parts": [{"text": text}]}
                     }
                     
-                    response = requests.post(url, headers=headers, json=payload, timeout=30)
+                    response = self.session.post(self._url, headers=_JSON_HEADERS, data=_dumps(payload), timeout=30)
                     response.raise_for_status()
                     
-                    result = response.json()
+                    result = _loads(response.content)
                     embedding = result.get("embedding", {}).get("values", [])
                     embeddings.append(embedding)
                 
                 return embeddings
                 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
             rag_logger.log_error("GeminiRESTEmbeddings._make_request", e)
             raise RuntimeError(f"Embedding request failed: {str(e)}")
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        """Embed a list of documents."""
+        """Embed a list of documents, sending each distinct text only once."""
         if not texts:
             return []
         
-        # Process in batches of 100 (Gemini's limit)
-        batch_size = 100
-        all_embeddings = []
+        unique_texts = list(dict.fromkeys(texts))
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            embeddings = self._make_request(batch, batch=True)
-            all_embeddings.extend(embeddings)
-            
-            # Rate limiting
-            if i + batch_size < len(texts):
-                time.sleep(0.1)
+        # Process in batches of 100 (Gemini's limit)
+        batches = [unique_texts[i:i + EMBED_BATCH_SIZE] for i in range(0, len(unique_texts), EMBED_BATCH_SIZE)]
+        if len(batches) == 1:
+            all_embeddings = self._make_request(batches[0], batch=True)
+        else:
+            # Send batches concurrently; the worker count caps in-flight requests and
+            # 429s are retried with backoff by the shared session
+            all_embeddings = []
+            with ThreadPoolExecutor(max_workers=min(EMBED_MAX_WORKERS, len(batches))) as executor:
+                for embeddings in executor.map(lambda batch: self._make_request(batch, batch=True), batches):
+                    all_embeddings.extend(embeddings)
         
-        return all_embeddings
+        return self._scatter(texts, unique_texts, all_embeddings)
     
-    def embed_query(self, text: str) -> List[float]:
-        """Embed a single query."""
+    @staticmethod
+    def _scatter(texts: List[str], unique_texts: List[str], embeddings: List[List[float]]) -> List[List[float]]:
+        """Map embeddings of the distinct texts back onto the original (possibly repeating) order."""
+        if len(unique_texts) == len(texts):
+            return embeddings
+        by_text = dict(zip(unique_texts, embeddings))
+        return [by_text[text] for text in texts]
+    
+    def _recall_query(self, text: str) -> Optional[np.ndarray]:
+        """Return a recently computed query vector, if any."""
+        key = (self.model, text)
+        with self._query_lock:
+            embedding = self._query_embeddings.get(key)
+            if embedding is not None:
+                self._query_embeddings.move_to_end(key)
+            return embedding
+
+    def _remember_query(self, text: str, values: List[float]) -> np.ndarray:
+        """Store a query vector as a read-only float32 array and return it."""
+        embedding = np.asarray(values, dtype=np.float32)
+        embedding.setflags(write=False)
+        if embedding.size:
+            with self._query_lock:
+                self._query_embeddings[(self.model, text)] = embedding
+                if len(self._query_embeddings) > EMBED_QUERY_CACHE_SIZE:
+                    self._query_embeddings.popitem(last=False)
+        return embedding
+
+    def embed_query_array(self, text: str) -> np.ndarray:
+        """Embed a single query as a read-only float32 vector, reusing recent results."""
+        embedding = self._recall_query(text)
+        if embedding is not None:
+            return embedding
+        
         embeddings = self._make_request([text], batch=False)
-        return embeddings[0] if embeddings else []
+        return self._remember_query(text, embeddings[0] if embeddings else [])
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query (cache lookup and retrieval embed the same text, so results are reused)."""
+        return self.embed_query_array(text).tolist()
+
+    async def _amake_request(self, texts: List[str]) -> List[List[float]]:
+        """Async batch embedding request using the shared httpx client."""
+        try:
+            payload = {
+                "requests": [
+                    {
+                        "model": self._model_path,
+                        "content": {"parts": [{"text": text}]}
+                    }
+                    for text in texts
+                ]
+            }
+            response = await _apost_with_retry(self._batch_url, _dumps(payload), timeout=30)
+            response.raise_for_status()
+            
+            result = _loads(response.content)
+            return [emb["values"] for emb in result.get("embeddings", [])]
+        
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            rag_logger.log_error("GeminiRESTEmbeddings._amake_request", e)
+            raise RuntimeError(f"Embedding request failed: {str(e)}")
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of documents without blocking the event loop."""
+        if not texts:
+            return []
+        
+        unique_texts = list(dict.fromkeys(texts))
+        batches = [unique_texts[i:i + EMBED_BATCH_SIZE] for i in range(0, len(unique_texts), EMBED_BATCH_SIZE)]
+        results = await asyncio.gather(*[self._amake_request(batch) for batch in batches])
+        return self._scatter(texts, unique_texts, [embedding for embeddings in results for embedding in embeddings])
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Embed a single query without blocking the event loop."""
+        embedding = self._recall_query(text)
+        if embedding is None:
+            embeddings = await self._amake_request([text])
+            embedding = self._remember_query(text, embeddings[0] if embeddings else [])
+        return embedding.tolist()
+
+
+# User-facing replies GeminiRESTChat returns instead of raising when a call fails
+_REPLY_GENERATION_FAILED = "Error generating response."
+_REPLY_BAD_REQUEST = "Hmm… the request didn’t look quite right. Could you please rephrase that?"
+_REPLY_RATE_LIMITED = "😅 Whoa, too many requests at once! Let’s pause for a second and try again."
+_REPLY_SERVER_ERROR = "The service seems to be having a rough day. Try again after a moment!"
+_REPLY_UNREACHABLE = "😕 I’m having trouble reaching the service right now. Could you try again later?"
+_REPLY_MALFORMED = "🙇 Sorry, I couldn’t process that properly. Mind trying again?"
+_REPLY_BLOCKED = "I cannot generate a response because it may violate content policies."
+_REPLY_UNAVAILABLE = "I apologize, but I'm having trouble processing your request right now."
+_REPLY_TIMEOUT = "⌛ The request took too long — maybe the servers need a quick coffee break. Please try again soon ☕"
+_REPLY_NETWORK = "🌐 Looks like there’s a little network hiccup. Please check your connection and try again!"
+_REPLY_BAD_JSON = "🤖 The server sent something strange that I couldn’t read. Let’s give it another try!"
+_REPLY_UNEXPECTED = "I encountered an unexpected error. Please try rephrasing your question."
+_GEMINI_FAILURE_REPLIES = frozenset({
+    _REPLY_GENERATION_FAILED,
+    _REPLY_BAD_REQUEST,
+    _REPLY_RATE_LIMITED,
+    _REPLY_SERVER_ERROR,
+    _REPLY_UNREACHABLE,
+    _REPLY_MALFORMED,
+    _REPLY_BLOCKED,
+    _REPLY_UNAVAILABLE,
+    _REPLY_TIMEOUT,
+    _REPLY_NETWORK,
+    _REPLY_BAD_JSON,
+    _REPLY_UNEXPECTED,
+})
 
 
 class GeminiRESTChat(BaseLLM):
@@ -191,6 +415,10 @@ class GeminiRESTChat(BaseLLM):
     top_p: float = Field(default=0.95, description="Top P")
     top_k: int = Field(default=40, description="Top K")
     endpoint: str = Field(default="", description="API endpoint")
+    session: Any = Field(default=None, exclude=True, description="HTTP session")
+    request_url: str = Field(default="", exclude=True, description="Endpoint URL with API key")
+    stream_url: str = Field(default="", exclude=True, description="Streaming endpoint URL with API key")
+    base_payload: Dict[str, Any] = Field(default_factory=dict, exclude=True, description="Request fields shared by every prompt")
     
     def __init__(
         self,
@@ -200,10 +428,27 @@ class GeminiRESTChat(BaseLLM):
         max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS,
         top_p: float = 0.95,
         top_k: int = 40,
+        session: Optional[requests.Session] = None,
         **kwargs
     ):
         # Initialize attributes before calling super().__init__
         endpoint = f"{GEMINI_API_BASE}/models/{model}:generateContent"
+        base_payload = {
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": 2048,
+                "topP": top_p,
+                "topK": top_k,
+                "stopSequences": []
+            },
+            # ✅ FIXED: Use valid threshold values
+            "safetySettings": [
+                {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+                {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+                {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+                {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"}
+            ]
+        }
         
         super().__init__(
             api_key=api_key,
@@ -213,6 +458,10 @@ class GeminiRESTChat(BaseLLM):
             top_p=top_p,
             top_k=top_k,
             endpoint=endpoint,
+            session=session or _SESSION,
+            request_url=f"{endpoint}?key={api_key}",
+            stream_url=f"{GEMINI_API_BASE}/models/{model}:streamGenerateContent?alt=sse&key={api_key}",
+            base_payload=base_payload,
             **kwargs
         )
     
@@ -227,19 +476,23 @@ class GeminiRESTChat(BaseLLM):
         run_manager: Optional[Any] = None,
         **kwargs: Any
     ) -> Any:
-        """Generate responses for prompts."""
+        """Generate responses for prompts, sending them concurrently over the pooled session."""
         from langchain_core.outputs import LLMResult, Generation
         
-        generations = []
-        for prompt in prompts:
+        def generate_one(prompt: str) -> str:
             try:
-                response_text = self._call_api(prompt)
-                generations.append([Generation(text=response_text)])
+                return self._call_api(prompt)
             except Exception as e:
                 rag_logger.log_error("GeminiRESTChat._generate", e)
-                generations.append([Generation(text="Error generating response.")])
+                return _REPLY_GENERATION_FAILED
+        
+        if len(prompts) <= 1:
+            texts = [generate_one(prompt) for prompt in prompts]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(prompts), CHAT_MAX_WORKERS)) as executor:
+                texts = list(executor.map(generate_one, prompts))
         
-        return LLMResult(generations=generations)
+        return LLMResult(generations=[[Generation(text=text)] for text in texts])
     
     def _call(
         self,
@@ -251,120 +504,185 @@ class GeminiRESTChat(BaseLLM):
         """Call the Gemini API."""
         return self._call_api(prompt)
     
+    def _build_payload(self, prompt: str) -> Dict[str, Any]:
+        """Build the generateContent request body for a prompt."""
+        return {"contents": [{"parts": [{"text": prompt}]}], **self.base_payload}
+
+    @staticmethod
+    def _http_status_message(status_code: int, error_body: str) -> str:
+        """Log a non-2xx Gemini response and map it to a user-facing message."""
+        # ✅ NEW: Better error handling for 400 errors
+        rag_logger.log_error(
+            "GeminiRESTChat._call_api_http_status", 
+            f"HTTP {status_code}: {error_body}"
+        )
+        
+        if status_code == 400:
+            return _REPLY_BAD_REQUEST
+        elif status_code == 429:
+            return _REPLY_RATE_LIMITED
+        elif status_code >= 500:
+            return _REPLY_SERVER_ERROR
+        else:
+            return _REPLY_UNREACHABLE
+
+    @staticmethod
+    def _parse_result(result: Dict[str, Any]) -> str:
+        """Extract the generated text from a decoded generateContent response."""
+        candidates = result.get("candidates")
+        if not candidates or not isinstance(candidates, list):
+            rag_logger.log_error("_call_api", f"Malformed response (no candidates): {result}")
+            return _REPLY_MALFORMED
+
+        candidate = candidates[0] or {}
+        finish_reason = (candidate.get("finishReason") or "").upper()
+
+        # Safety or truncation handling
+        if finish_reason == "SAFETY":
+            rag_logger.log_error("_call_api", "Response blocked by safety filters")
+            return _REPLY_BLOCKED
+        elif finish_reason == "MAX_TOKENS":
+            rag_logger.logger.warning("⚠️ Response truncated due to max tokens")
+
+        content = candidate.get("content") or {}
+        parts = content.get("parts")
+        if not parts or not isinstance(parts, list):
+            rag_logger.log_error("_call_api", f"Malformed candidate content: {candidate}")
+            return _REPLY_UNAVAILABLE
+
+        # Join multiple text parts (almost every response has exactly one)
+        if len(parts) == 1 and isinstance(parts[0], dict):
+            text = (parts[0].get("text") or "").strip()
+        else:
+            text = " ".join([p["text"].strip() for p in parts if isinstance(p, dict) and p.get("text")])
+
+        if not text.strip():
+            rag_logger.log_error("_call_api", f"Empty text in response: {candidate}")
+            return _REPLY_UNAVAILABLE
+
+        # Warn if incomplete response
+        if len(text) < 50 or not text.strip().endswith(_SENTENCE_ENDINGS):
+            rag_logger.logger.warning(
+                f"⚠️ Potentially incomplete response: len={len(text)}, finish_reason={finish_reason}"
+            )
+
+        return text.strip()
+
     def _call_api(self, prompt: str) -> str:
         """Make REST API call to Gemini with proper safety controls."""
         try:
-            headers = {"Content-Type": "application/json"}
-
-            payload = {
-                "contents": [
-                    {"parts": [{"text": prompt}]}
-                ],
-                "generationConfig": {
-                    "temperature": self.temperature,
-                    "maxOutputTokens": 2048,
-                    "topP": self.top_p,
-                    "topK": self.top_k,
-                    "stopSequences": []
-                },
-                # ✅ FIXED: Use valid threshold values
-                "safetySettings": [
-                    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"}
-                ]
-            }
-
-            url = f"{self.endpoint}?key={self.api_key}"
+            payload = self._build_payload(prompt)
 
             try:
-                response = requests.post(url, headers=headers, json=payload, timeout=60)
+                response = self.session.post(self.request_url, headers=_JSON_HEADERS, data=_dumps(payload), timeout=60)
                 response.raise_for_status()
             except requests.Timeout:
                 rag_logger.log_error("GeminiRESTChat._call_api_timeout", "Request timed out")
-                return "⌛ The request took too long — maybe the servers need a quick coffee break. Please try again soon ☕"
+                return _REPLY_TIMEOUT
             except requests.exceptions.HTTPError as http_err:
-                # ✅ NEW: Better error handling for 400 errors
-                status_code = http_err.response.status_code
-                error_body = http_err.response.text[:500]
-                
-                rag_logger.log_error(
-                    "GeminiRESTChat._call_api_http_status", 
-                    f"HTTP {status_code}: {error_body}"
-                )
-                
-                if status_code == 400:
-                    return "Hmm… the request didn’t look quite right. Could you please rephrase that?"
-                elif status_code == 429:
-                    return "😅 Whoa, too many requests at once! Let’s pause for a second and try again."
-                elif status_code >= 500:
-                    return "The service seems to be having a rough day. Try again after a moment!"
-                else:
-                    return "😕 I’m having trouble reaching the service right now. Could you try again later?"
-                    
+                return self._http_status_message(http_err.response.status_code, http_err.response.text[:500])
             except requests.ConnectionError as e:
                 rag_logger.log_error("GeminiRESTChat._call_api_connection", e)
-                return "🌐 Looks like there’s a little network hiccup. Please check your connection and try again!"
+                return _REPLY_NETWORK
             except requests.RequestException as e:
                 rag_logger.log_error("GeminiRESTChat._call_api_http", e)
-                return "😕 I’m having trouble reaching the service right now. Could you try again later?"
+                return _REPLY_UNREACHABLE
 
             try:
-                result = response.json()
+                result = _loads(response.content)
             except ValueError as e:
                 rag_logger.log_error("GeminiRESTChat._call_api_json_error", f"Invalid JSON: {e}, raw={response.text[:200]}")
-                return "🤖 The server sent something strange that I couldn’t read. Let’s give it another try!"
-
-            candidates = result.get("candidates")
-            if not candidates or not isinstance(candidates, list):
-                rag_logger.log_error("_call_api", f"Malformed response (no candidates): {result}")
-                return "🙇 Sorry, I couldn’t process that properly. Mind trying again?"
-
-            candidate = candidates[0] or {}
-            finish_reason = (candidate.get("finishReason") or "").upper()
-
-            # Safety or truncation handling
-            if finish_reason == "SAFETY":
-                rag_logger.log_error("_call_api", "Response blocked by safety filters")
-                return "I cannot generate a response because it may violate content policies."
-            elif finish_reason == "MAX_TOKENS":
-                rag_logger.logger.warning("⚠️ Response truncated due to max tokens")
-
-            content = candidate.get("content") or {}
-            parts = content.get("parts")
-            if not parts or not isinstance(parts, list):
-                rag_logger.log_error("_call_api", f"Malformed candidate content: {candidate}")
-                return "I apologize, but I'm having trouble processing your request right now."
-
-            # Join multiple text parts safely
-            try:
-                text = " ".join(
-                    p.get("text", "").strip()
-                    for p in parts
-                    if isinstance(p, dict) and p.get("text")
-                )
-            except Exception as e:
-                rag_logger.log_error("_call_api_text_extraction", e)
-                return "An internal error occurred while parsing the response."
+                return _REPLY_BAD_JSON
 
-            if not text.strip():
-                rag_logger.log_error("_call_api", f"Empty text in response: {candidate}")
-                return "I apologize, but I'm having trouble processing your request right now."
+            return self._parse_result(result)
 
-            # Warn if incomplete response
-            if len(text) < 50 or not text.strip().endswith(('.', '!', '?', '।', '।।')):
-                rag_logger.logger.warning(
-                    f"⚠️ Potentially incomplete response: len={len(text)}, finish_reason={finish_reason}"
-                )
+        except Exception as e:
+            rag_logger.log_error("GeminiRESTChat._call_api_unexpected", e)
+            return _REPLY_UNEXPECTED
 
-            return text.strip()
+    def _stream_api(self, prompt: str) -> Iterator[str]:
+        """Yield response text as Gemini streams it (server-sent events)."""
+        try:
+            payload = self._build_payload(prompt)
+            with self.session.post(self.stream_url, headers=_JSON_HEADERS, data=_dumps(payload), timeout=60, stream=True) as response:
+                if response.status_code >= 400:
+                    yield self._http_status_message(response.status_code, response.text[:500])
+                    return
+                
+                for line in response.iter_lines():
+                    if not line.startswith(b"data:"):
+                        continue
+                    candidates = _loads(line[5:].strip()).get("candidates") or [{}]
+                    candidate = candidates[0] or {}
+                    
+                    if (candidate.get("finishReason") or "").upper() == "SAFETY":
+                        rag_logger.log_error("_stream_api", "Response blocked by safety filters")
+                        yield _REPLY_BLOCKED
+                        return
+                    
+                    parts = (candidate.get("content") or {}).get("parts") or []
+                    text = "".join([p["text"] for p in parts if isinstance(p, dict) and p.get("text")])
+                    if text:
+                        yield text
+        
+        except requests.Timeout:
+            rag_logger.log_error("GeminiRESTChat._stream_api_timeout", "Request timed out")
+            yield _REPLY_TIMEOUT
+        except requests.RequestException as e:
+            rag_logger.log_error("GeminiRESTChat._stream_api_http", e)
+            yield _REPLY_UNREACHABLE
+        except ValueError as e:
+            rag_logger.log_error("GeminiRESTChat._stream_api_json_error", e)
+            yield _REPLY_BAD_JSON
+
+    def _stream(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[Any] = None,
+        **kwargs: Any
+    ) -> Iterator[Any]:
+        """Stream generation chunks for LangChain's .stream(); invoke() keeps using _call_api."""
+        from langchain_core.outputs import GenerationChunk
+        
+        for text in self._stream_api(prompt):
+            chunk = GenerationChunk(text=text)
+            if run_manager:
+                run_manager.on_llm_new_token(text, chunk=chunk)
+            yield chunk
+
+    async def _acall_api(self, prompt: str) -> str:
+        """Async variant of _call_api using the shared httpx client."""
+        try:
+            payload = self._build_payload(prompt)
+
+            try:
+                response = await _apost_with_retry(self.request_url, _dumps(payload))
+                response.raise_for_status()
+            except httpx.TimeoutException:
+                rag_logger.log_error("GeminiRESTChat._acall_api_timeout", "Request timed out")
+                return _REPLY_TIMEOUT
+            except httpx.HTTPStatusError as http_err:
+                return self._http_status_message(http_err.response.status_code, http_err.response.text[:500])
+            except httpx.ConnectError as e:
+                rag_logger.log_error("GeminiRESTChat._acall_api_connection", e)
+                return _REPLY_NETWORK
+            except httpx.HTTPError as e:
+                rag_logger.log_error("GeminiRESTChat._acall_api_http", e)
+                return _REPLY_UNREACHABLE
+
+            try:
+                result = _loads(response.content)
+            except ValueError as e:
+                rag_logger.log_error("GeminiRESTChat._acall_api_json_error", f"Invalid JSON: {e}, raw={response.text[:200]}")
+                return _REPLY_BAD_JSON
+
+            return self._parse_result(result)
 
         except Exception as e:
-            rag_logger.log_error("GeminiRESTChat._call_api_unexpected", e)
-            return "I encountered an unexpected error. Please try rephrasing your question."
+            rag_logger.log_error("GeminiRESTChat._acall_api_unexpected", e)
+            return _REPLY_UNEXPECTED
 
-    
     async def _agenerate(
         self,
         prompts: List[str],
@@ -372,8 +690,12 @@ class GeminiRESTChat(BaseLLM):
         run_manager: Optional[Any] = None,
         **kwargs: Any
     ) -> Any:
-        """Async generate - falls back to sync."""
-        return self._generate(prompts, stop, run_manager, **kwargs)
+        """Generate responses for prompts concurrently without blocking the event loop."""
+        from langchain_core.outputs import LLMResult, Generation
+        
+        # _acall_api never raises, so every prompt gets a generation
+        texts = await asyncio.gather(*[self._acall_api(prompt) for prompt in prompts])
+        return LLMResult(generations=[[Generation(text=text)] for text in texts])
 
 
 # ============================================================================
@@ -390,6 +712,66 @@ def validate_gemini_api_key() -> bool:
     except Exception as e:
         rag_logger.log_error("validate_gemini_api. Rag.py", e)
 
+# Prompt injection or system override patterns filtered out of user queries
+INJECTION_PATTERNS = [
+    r'ignore\s+previous\s+instructions',
+    r'disregard\s+.*instructions',
+    r'system\s*:',
+    r'forget\s+.*above',
+    r'override\s+.*rules',
+    r'new\s+.*instructions',
+    r'ignore\s+all\s+.*rules',
+    r'pretend\s+to\s+be',
+    r'you\s+are\s+no\s+longer\s+an\s+AI',
+    r'disable\s+.*safety',
+    r'reset\s+.*context',
+    r'role\s*:',
+    r'mode\s*:',
+]
+
+# Compiled once at import; sanitize_query runs on every inbound message
+# Control chars (except common whitespace) plus null bytes and invisible unicode separators
+_STRIP_CHARS_RE = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F\u200B-\u200F\u202A-\u202E\u2060-\u206F\uFEFF]')
+_SCRIPT_RE = re.compile(r'<\s*script.*?>.*?<\s*/\s*script\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<.*?>')
+_INJECTION_RES = [(p, re.compile(p, re.IGNORECASE)) for p in INJECTION_PATTERNS]
+# Single alternation used as a one-pass pre-check; clean queries skip the per-pattern loop
+_INJECTION_RE = re.compile('|'.join(f'(?:{p})' for p in INJECTION_PATTERNS), re.IGNORECASE)
+_REPEATED_SPECIAL_RE = re.compile(r'[`~]{2,}|["\']{3,}|[{}]{3,}')
+
+SANITIZE_CACHE_MAX_FACTOR = 4  # only memoize raw inputs up to max_length * 4 characters
+
+@lru_cache(maxsize=1024)
+def _sanitize_impl(query: str, max_length: int) -> Tuple[str, Tuple[str, ...]]:
+    """Sanitize a non-empty query; returns the result and the injection patterns it matched."""
+    # Normalize Unicode (prevents hidden homoglyph tricks)
+    query = unicodedata.normalize("NFKC", query)
+
+    # Truncate excessively long inputs
+    query = query[:max_length]
+
+    # Remove control chars, null bytes and invisible unicode separators in one pass
+    query = _STRIP_CHARS_RE.sub('', query)
+
+    # Sanitize HTML/script-like payloads
+    query = _SCRIPT_RE.sub('[filtered]', query)
+    query = _TAG_RE.sub('[filtered]', query)  # filter raw HTML tags
+
+    # Filter prompt injection or system override patterns
+    sanitized = query
+    detected = []
+    if _INJECTION_RE.search(sanitized):
+        for pattern, compiled in _INJECTION_RES:
+            if compiled.search(sanitized):
+                detected.append(pattern)
+                sanitized = compiled.sub('[filtered]', sanitized)
+
+    # Remove repeated special characters often used in injection
+    sanitized = _REPEATED_SPECIAL_RE.sub('', sanitized)
+
+    # Strip leading/trailing whitespace
+    return sanitized.strip(), tuple(detected)
+
 def sanitize_query(query: str, max_length: int = 2000) -> str:
     """
     Strong multilingual input sanitizer for user queries.
@@ -399,55 +781,18 @@ def sanitize_query(query: str, max_length: int = 2000) -> str:
     """
 
     try:
-        import unicodedata
         if not isinstance(query, str) or not query.strip():
             return ""
 
-        # Normalize Unicode (prevents hidden homoglyph tricks)
-        query = unicodedata.normalize("NFKC", query)
-
-        # Truncate excessively long inputs
-        query = query[:max_length]
-
-        # Remove control chars (except common whitespace)
-        query = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]', '', query)
-
-        # Remove null bytes and invisible unicode separators
-        query = re.sub(r'[\u200B-\u200F\u202A-\u202E\u2060-\u206F\uFEFF]', '', query)
-
-        # Sanitize HTML/script-like payloads
-        query = re.sub(r'<\s*script.*?>.*?<\s*/\s*script\s*>', '[filtered]', query, flags=re.IGNORECASE | re.DOTALL)
-        query = re.sub(r'<.*?>', '[filtered]', query)  # filter raw HTML tags
-
-        # Filter prompt injection or system override patterns
-        injection_patterns = [
-            r'ignore\s+previous\s+instructions',
-            r'disregard\s+.*instructions',
-            r'system\s*:',
-            r'forget\s+.*above',
-            r'override\s+.*rules',
-            r'new\s+.*instructions',
-            r'ignore\s+all\s+.*rules',
-            r'pretend\s+to\s+be',
-            r'you\s+are\s+no\s+longer\s+an\s+AI',
-            r'disable\s+.*safety',
-            r'reset\s+.*context',
-            r'role\s*:',
-            r'mode\s*:',
-        ]
-
-        sanitized = query
-        for pattern in injection_patterns:
-            if re.search(pattern, sanitized, re.IGNORECASE):
-                # Log suspicious attempt (you can replace this with your logger)
-                print(f"[SECURITY] Prompt injection detected: {pattern}")
-                sanitized = re.sub(pattern, '[filtered]', sanitized, flags=re.IGNORECASE)
-
-        # Remove repeated special characters often used in injection
-        sanitized = re.sub(r'[`~]{2,}|["\']{3,}|[{}]{3,}', '', sanitized)
-
-        # Strip leading/trailing whitespace
-        sanitized = sanitized.strip()
+        # Repeated queries are memoized; very long inputs bypass the cache so it stays small
+        if len(query) <= max_length * SANITIZE_CACHE_MAX_FACTOR:
+            sanitized, detected = _sanitize_impl(query, max_length)
+        else:
+            sanitized, detected = _sanitize_impl.__wrapped__(query, max_length)
+
+        for pattern in detected:
+            # Log suspicious attempt (you can replace this with your logger)
+            print(f"[SECURITY] Prompt injection detected: {pattern}")
 
         # Fallback: ensure result isn’t empty or maliciously wiped
         if not sanitized:
@@ -465,41 +810,147 @@ def sanitize_query(query: str, max_length: int = 2000) -> str:
 
 import time
 import hashlib
+from collections import OrderedDict, deque
 from threading import Lock
 from typing import List, Dict, Optional, Any
 
+def _cache_key(query: str) -> str:
+    """Case-insensitive in-memory cache key for a query (128-bit BLAKE2b; not a security hash)."""
+    return hashlib.blake2b(query.lower().encode(), digest_size=16).hexdigest()
+
+
+# Words that pick a different menu variant; paraphrase hits must agree on these and on numbers
+_SIZE_WORDS = frozenset({
+    "small", "medium", "large", "regular", "mini", "half", "full", "single", "double",
+    "xl", "kg", "g", "gm", "gram", "grams", "ml", "l", "litre", "liter", "pcs", "piece", "pieces",
+})
+
+def _query_guard(query: str) -> frozenset:
+    """Numeric and size tokens of a query; a semantic cache hit must have exactly the same set."""
+    return frozenset(t for t in _bm25_query_tokens(query) if t in _SIZE_WORDS or any(c.isdigit() for c in t))
+
+
 class RAGCache:
     """Thread-safe in-memory cache for RAG operations with sanitized inputs."""
 
     def __init__(self, max_history_size: int = 50, max_query_cache: int = 200):
         self._lock = Lock()
-        self.conversation_history: Dict[str, List[Dict[str, Any]]] = {}
-        self.query_cache: Dict[str, Dict[str, Any]] = {}
+        self.conversation_history: Dict[str, deque] = {}
+        self.query_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.max_history_size = max_history_size
         self.max_query_cache = max_query_cache
         self.vectorstore = None
         self.bm25_retriever = None
         self.chunks = None
         self.similarity_threshold = 0.3
+        # Semantic layer: normalised query embeddings, row i belongs to _embedding_keys[i]
+        self.semantic_threshold = SEMANTIC_CACHE_THRESHOLD
+        self._embed_fn = None
+        self._embedding_matrix: Optional[np.ndarray] = None
+        self._embedding_keys: List[str] = []
+        # Query cache effectiveness counters (exact + semantic hits)
+        self.hits = 0
+        self.misses = 0
+
+    def set_embedder(self, embed_fn):
+        """Enable paraphrase lookups with a function that maps text to an embedding."""
+        self._embed_fn = embed_fn
+
+    def _embed(self, query: str) -> Optional[np.ndarray]:
+        """Return the L2-normalised float32 embedding of a query, or None if unavailable."""
+        if self._embed_fn is None:
+            return None
+        vector = np.asarray(self._embed_fn(query), dtype=np.float32)
+        norm = float(np.linalg.norm(vector)) if vector.size else 0.0
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def _store_query(self, key: str, entry: Dict[str, Any]):
+        """Insert into query_cache with LRU eviction. Caller must hold _lock."""
+        if key in self.query_cache:
+            self.query_cache.move_to_end(key)
+        elif len(self.query_cache) >= self.max_query_cache:
+            # evict least recently used
+            self.query_cache.popitem(last=False)
+        self.query_cache[key] = entry
+
+    def _add_embedding(self, key: str, vector: np.ndarray):
+        """Append a query vector to the semantic index. Caller must hold _lock."""
+        matrix = self._embedding_matrix
+        if matrix is None or matrix.shape[1] != vector.shape[0]:
+            matrix = np.empty((16, vector.shape[0]), dtype=np.float32)
+            self._embedding_keys = []
+        
+        count = len(self._embedding_keys)
+        if count == matrix.shape[0]:
+            # Drop rows whose entries were evicted, then grow by doubling if still full
+            live = [i for i, k in enumerate(self._embedding_keys) if k in self.query_cache]
+            matrix[:len(live)] = matrix[live]
+            self._embedding_keys = [self._embedding_keys[i] for i in live]
+            count = len(live)
+            if count == matrix.shape[0]:
+                grown = np.empty((count * 2, matrix.shape[1]), dtype=np.float32)
+                grown[:count] = matrix
+                matrix = grown
+        
+        matrix[count] = vector
+        self._embedding_keys.append(key)
+        self._embedding_matrix = matrix
+
+    def _semantic_lookup(self, vector: np.ndarray, guard: frozenset, max_age_seconds: int, now: float) -> Optional[Dict]:
+        """
+        Return the closest fresh entry whose query is a paraphrase with the same
+        numbers and sizes ("large pizza" never answers "medium pizza"). Caller must hold _lock.
+        """
+        count = len(self._embedding_keys)
+        if not count or self._embedding_matrix.shape[1] != vector.shape[0]:
+            return None
+        scores = self._embedding_matrix[:count] @ vector
+        candidates = np.flatnonzero(scores >= self.semantic_threshold)
+        for i in candidates[np.argsort(-scores[candidates])]:
+            data = self.query_cache.get(self._embedding_keys[i])
+            if data and data.get('guard') == guard and (now - data['timestamp'] <= max_age_seconds):
+                return data
+        return None
         
     def add_to_history(self, client_id: str, role: str, content: str):
         """Add conversation turn safely with input validation."""
         try:
             if not isinstance(content, str) or not content.strip():
                 return
+            turn = {
+                'role': role,
+                'content': content.strip(),
+                'timestamp': time.time()
+            }
             with self._lock:
-                self.conversation_history.setdefault(client_id, []).append({
-                    'role': role,
-                    'content': content.strip(),
-                    'timestamp': time.time()
-                })
-                self.conversation_history[client_id] = self.conversation_history[client_id][-self.max_history_size:]
+                history = self.conversation_history.get(client_id)
+                if history is None:
+                    # bounded deque drops the oldest turn on append
+                    history = self.conversation_history[client_id] = deque(maxlen=self.max_history_size)
+                history.append(turn)
         except Exception as e:
             rag_logger.log_error("add_to_history. Rag.py", e)
 
     def get_history(self, client_id: str) -> List[Dict[str, str]]:
         with self._lock:
-            return list(self.conversation_history.get(client_id, []))
+            return list(self.conversation_history.get(client_id, ()))
+
+    def history_length(self, client_id: str) -> int:
+        """Number of stored turns for a client, without copying them."""
+        with self._lock:
+            return len(self.conversation_history.get(client_id, ()))
+
+    def get_recent_history(self, client_id: str, turns: int = 1) -> List[Dict[str, str]]:
+        """Return only the last `turns` entries without copying the whole deque."""
+        with self._lock:
+            history = self.conversation_history.get(client_id)
+            if not history or turns <= 0:
+                return []
+            if turns == 1:
+                return [history[-1]]
+            return list(history)[-turns:]
 
     def clear_history(self, client_id: str):
         with self._lock:
@@ -510,33 +961,74 @@ class RAGCache:
         try:
             if not query or not context:
                 return
-            query_hash = hashlib.sha256(query.lower().encode()).hexdigest()
+            # Hash and build the entry before locking; the lock only guards the dict update
+            query_hash = _cache_key(query)
+            entry = {
+                'context': context,
+                'timestamp': time.monotonic(),
+                'relevance': relevance_score,
+                'guard': _query_guard(query)
+            }
             with self._lock:
-                if len(self.query_cache) >= self.max_query_cache:
-                    oldest_key = next(iter(self.query_cache))
-                    del self.query_cache[oldest_key]
-                self.query_cache[query_hash] = {
-                    'context': context,
-                    'timestamp': time.time(),
-                    'relevance': relevance_score
-                }
+                is_new = query_hash not in self.query_cache
+                self._store_query(query_hash, entry)
+            
+            if is_new and self._embed_fn is not None:
+                vector = self._embed(query)
+                if vector is not None:
+                    with self._lock:
+                        self._add_embedding(query_hash, vector)
         except Exception as e:
             rag_logger.log_error("cache_query_result. Rag.py", e)
 
-    def get_cached_query(self, query: str, max_age_seconds: int = 600) -> Optional[Dict]:
+    def get_cached_query(self, query: str, max_age_seconds: int = 600, semantic: bool = True) -> Optional[Dict]:
+        """
+        Exact lookup, then (if semantic) the closest paraphrase. Paraphrase hits are
+        not stored under this query's key, so exact-only readers never see them.
+        """
         try:
             if not query:
                 return None
-            query_hash = hashlib.sha256(query.lower().encode()).hexdigest()
+            query_hash = _cache_key(query)
+            now = time.monotonic()
             with self._lock:
                 data = self.query_cache.get(query_hash)
-                if data and (time.time() - data['timestamp'] <= max_age_seconds):
+                if data and (now - data['timestamp'] <= max_age_seconds):
+                    self.query_cache.move_to_end(query_hash)
+                    self.hits += 1
                     return data
                 self.query_cache.pop(query_hash, None)
-            return None
+            
+            if not semantic:
+                with self._lock:
+                    self.misses += 1
+                return None
+            
+            # Exact miss: look for a paraphrase with the same numbers and sizes
+            vector = self._embed(query)
+            guard = _query_guard(query)
+            now = time.monotonic()
+            with self._lock:
+                data = self._semantic_lookup(vector, guard, max_age_seconds, now) if vector is not None else None
+                if data:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                return data
         except Exception as e:
             rag_logger.log_error("cache_query_result. Rag.py", e)
 
+    def peek_context(self, query: str, max_age_seconds: int = 600) -> Optional[str]:
+        """Exact-match context lookup that skips the semantic layer, LRU promotion and stats."""
+        if not query:
+            return None
+        query_hash = _cache_key(query)
+        with self._lock:
+            data = self.query_cache.get(query_hash)
+        if data and 'context' in data and (time.monotonic() - data['timestamp'] <= max_age_seconds):
+            return data['context']
+        return None
+
     def store_vectorstore(self, vectorstore, bm25_retriever, chunks):
         with self._lock:
             self.vectorstore = vectorstore
@@ -551,7 +1043,10 @@ class RAGCache:
         """Retrieve a cached value by key, if available."""
         try:
             with self._lock:
-                return self.query_cache.get(key)
+                data = self.query_cache.get(key)
+                if data is not None:
+                    self.query_cache.move_to_end(key)
+                return data
         except Exception as e:
             rag_logger.log_error("cache.get", e)
             return None
@@ -559,20 +1054,137 @@ class RAGCache:
     def set(self, key: str, value: Any):
         """Store a value in cache with automatic eviction if full."""
         try:
+            entry = {
+                'value': value,
+                'timestamp': time.monotonic()
+            }
             with self._lock:
-                if len(self.query_cache) >= self.max_query_cache:
-                    # remove oldest item (FIFO)
-                    oldest_key = next(iter(self.query_cache))
-                    del self.query_cache[oldest_key]
-                self.query_cache[key] = {
-                    'value': value,
-                    'timestamp': time.time()
-                }
+                self._store_query(key, entry)
         except Exception as e:
             rag_logger.log_error("cache.set", e)
 
 
 
+# ============================================================================
+# MENU PRICE PATTERNS
+# ============================================================================
+
+_PRICE_RE = re.compile(r'(?:₹|rs\.?|inr)?\s*(\d+(?:\.\d{1,2})?)')
+
+@lru_cache(maxsize=512)
+def _menu_price_patterns(foodname: str, size: Optional[str]) -> Tuple[re.Pattern, ...]:
+    """
+    Compiled price-lookup patterns for a normalized (foodname, size) pair.
+    Matches: "masala dosa ....... ₹90" or "masala dosa - ₹90" or "masala dosa: 90"
+    """
+    food = re.escape(foodname)
+    sized = re.escape(size) if size else ''
+    price = r"\s*[.\-:]*\s*(?:₹|rs\.?|inr)?\s*(\d+(?:\.\d{1,2})?)"
+    return (
+        # Pattern 1: Item name followed by dots/dashes and price
+        re.compile(rf"{food}{price}", re.IGNORECASE),
+        # Pattern 2: With size
+        re.compile(rf"{food}\s+{sized}{price}", re.IGNORECASE),
+        # Pattern 3: Size before item
+        re.compile(rf"{sized}\s+{food}{price}", re.IGNORECASE),
+    )
+
+
+# C0/C1 control characters removed from uploaded documents
+_DOC_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])
+
+_BM25_TOKEN_RE = re.compile(r"\w+")
+
+def _bm25_tokenize(text: str) -> List[str]:
+    """Case-insensitive word tokens for BM25; used as-is to index the chunks."""
+    return _BM25_TOKEN_RE.findall(text.lower())
+
+@lru_cache(maxsize=1024)
+def _bm25_query_tokens(text: str) -> Tuple[str, ...]:
+    """Tokens of a user query, memoized because the cache guard and the BM25 retriever both
+    tokenize it; a tuple so no caller can mutate the shared result."""
+    return tuple(_bm25_tokenize(text))
+
+
+# Process-wide index cache: (document hash, top_k) -> (vectorstore, bm25_retriever, chunks).
+# Bots rebuilt after RAGCacheManager expiry, or created for the same text, skip re-embedding.
+_INDEX_CACHE: "OrderedDict[Tuple[str, int], Tuple[Any, Any, List[Any]]]" = OrderedDict()
+_INDEX_CACHE_LOCK = Lock()
+
+
+# Translation targets with their own script (same ranges as EfficientTranslator in Features.py).
+# Text already written in the target's script is returned without an LLM call.
+_TRANSLATION_SCRIPTS = {
+    "hindi": (0x0900, 0x097F),
+    "gujarati": (0x0A80, 0x0AFF),
+}
+
+def _is_written_in(text: str, low: int, high: int) -> bool:
+    """True when most letters of the text fall in the [low, high] codepoint range."""
+    letters = in_script = 0
+    for ch in text:
+        if ch.isalpha():
+            letters += 1
+            if low <= ord(ch) <= high:
+                in_script += 1
+    return in_script * 2 > letters
+
+
+# Process-wide translation cache: (text digest, language) -> (translation, stored_at).
+# Translations don't depend on the client, and app.py builds a fresh RAGBot per message.
+_TRANSLATION_CACHE: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+_TRANSLATION_CACHE_LOCK = Lock()
+
+def _translation_key(text: str, language: str) -> Tuple[str, str]:
+    """Cache key for a translation; the text is hashed so long messages aren't kept twice."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest(), language.strip().lower()
+
+def _recall_translation(key: Tuple[str, str]) -> Optional[str]:
+    """Return a fresh cached translation, or None."""
+    with _TRANSLATION_CACHE_LOCK:
+        entry = _TRANSLATION_CACHE.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] > TRANSLATION_CACHE_TTL:
+            del _TRANSLATION_CACHE[key]
+            return None
+        _TRANSLATION_CACHE.move_to_end(key)
+        return entry[0]
+
+def _remember_translation(key: Tuple[str, str], translation: str):
+    """Store a translation, evicting the least recently used entry when full."""
+    with _TRANSLATION_CACHE_LOCK:
+        _TRANSLATION_CACHE[key] = (translation, time.monotonic())
+        _TRANSLATION_CACHE.move_to_end(key)
+        if len(_TRANSLATION_CACHE) > TRANSLATION_CACHE_SIZE:
+            _TRANSLATION_CACHE.popitem(last=False)
+
+
+# Marker line preceding each text in a batched translation prompt and its reply
+_TRANSLATION_MARKER_RE = re.compile(r"^\s*\[\[(\d+)\]\]\s*$", re.MULTILINE)
+
+# Sentence boundary for splitting long translations (separator whitespace is captured)
+_TRANSLATION_SENTENCE_RE = re.compile(r'(?<=[.!?।])(\s+)')
+
+def _split_for_translation(text: str) -> List[List[str]]:
+    """Group sentences into [piece, trailing_whitespace] pairs of at most MAX_TRANSLATE_CHARS where possible."""
+    parts = _TRANSLATION_SENTENCE_RE.split(text)
+    pieces: List[List[str]] = []
+    for i in range(0, len(parts), 2):
+        sentence = parts[i]
+        separator = parts[i + 1] if i + 1 < len(parts) else ""
+        if pieces and (not sentence.strip() or len(pieces[-1][0]) + len(pieces[-1][1]) + len(sentence) <= MAX_TRANSLATE_CHARS):
+            pieces[-1][0] += pieces[-1][1] + sentence
+            pieces[-1][1] = separator
+        else:
+            pieces.append([sentence, separator])
+    return pieces
+
+
+# Translations currently waiting on the LLM, so identical concurrent requests share one call
+_TRANSLATION_INFLIGHT: Dict[Tuple[str, str], "asyncio.Future[str]"] = {}
+
+
 # ============================================================================
 # IMPROVED RAG BOT CLASS
 # ============================================================================
@@ -591,9 +1203,11 @@ class RAGBot:
             
             if not document_text or not isinstance(document_text, str):
                 raise ValueError("Document text must be a non-empty string.")
-            document_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', document_text).strip()
+            document_text = document_text.translate(_DOC_CTRL_TABLE).strip()
             self.document_text = document_text[:100000]
+            self._menu_text = self.document_text.lower()  # price verification scans this directly
             self.client_id = client_id
+            self._client_id_hashed = hash_for_logging(client_id)  # client_id never changes; hash once for logs
             self.top_k = max(3, min(top_k, 10))
             self.firestore_client = db
 
@@ -605,7 +1219,8 @@ class RAGBot:
             self.embeddings = None
             self.retriever = None
             self.chain = None
-            self.translation_chain = None 
+            self._translation_template = None
+            self._translation_batch_template = None
             self.chain_res = None
             
             self.sender_number = sender_number
@@ -660,6 +1275,7 @@ class RAGBot:
                 api_key=api_key,
                 model=DEFAULT_EMBEDDING_MODEL
             )
+            self.cache.set_embedder(self.embeddings.embed_query_array)
             
             rag_logger.logger.info("✓ Embeddings initialized successfully (REST API)")
             
@@ -670,11 +1286,21 @@ class RAGBot:
     def _setup_retriever_from_string(self):
         """Setup enhanced retriever with better chunking strategy."""
         try:
+            index_key = (hashlib.sha256(self.document_text.encode()).hexdigest(), self.top_k)
+            with _INDEX_CACHE_LOCK:
+                shared_index = _INDEX_CACHE.get(index_key)
+                if shared_index is not None:
+                    _INDEX_CACHE.move_to_end(index_key)
+            
             if self.cache.has_vectorstore():
                 rag_logger.logger.info("✓ Using cached vectorstore")
                 vectorstore = self.cache.vectorstore
                 bm25_retriever = self.cache.bm25_retriever
                 chunks = self.cache.chunks
+            elif shared_index is not None:
+                rag_logger.logger.info("✓ Using shared vectorstore for identical document")
+                vectorstore, bm25_retriever, chunks = shared_index
+                self.cache.store_vectorstore(vectorstore, bm25_retriever, chunks)
             else:
                 base_doc = Document(
                     page_content=self.document_text,
@@ -704,14 +1330,24 @@ class RAGBot:
                 if not chunks:
                     raise ValueError("No chunks created from document")
                 
+                # Integer ids let the ensemble fuse results without hashing page_content
+                for chunk_id, chunk in enumerate(chunks):
+                    chunk.metadata["chunk_id"] = chunk_id
+                
                 rag_logger.logger.info(f"✓ Created {len(chunks)} chunks")
                 
                 vectorstore = FAISS.from_documents(chunks, self.embeddings)
                 
-                bm25_retriever = BM25Retriever.from_documents(chunks)
+                bm25_retriever = BM25Retriever.from_documents(chunks, preprocess_func=_bm25_tokenize)
+                # Chunks are tokenized once above; only queries go through the memoized tokenizer
+                bm25_retriever.preprocess_func = _bm25_query_tokens
                 bm25_retriever.k = self.top_k
                 
                 self.cache.store_vectorstore(vectorstore, bm25_retriever, chunks)
+                with _INDEX_CACHE_LOCK:
+                    _INDEX_CACHE[index_key] = (vectorstore, bm25_retriever, chunks)
+                    if len(_INDEX_CACHE) > INDEX_CACHE_SIZE:
+                        _INDEX_CACHE.popitem(last=False)
                 rag_logger.logger.info("✓ Vectorstore cached")
             
             faiss_retriever = vectorstore.as_retriever(
@@ -723,7 +1359,8 @@ class RAGBot:
             
             self.retriever = EnsembleRetriever(
                 retrievers=[faiss_retriever, bm25_retriever],
-                weights=[0.65, 0.35]
+                weights=[0.65, 0.35],
+                id_key="chunk_id"
             )
             
             rag_logger.logger.info("✓ Retriever ready")
@@ -736,7 +1373,10 @@ class RAGBot:
     def _setup_chain(self):
         """Setup enhanced RAG chain with improved prompting."""
         try:
-            prompt_template = ChatPromptTemplate.from_template("""You are warm and friendly AI assistant - like the smiling team member who helps customers discover delicious treats!
+            # The instruction block never changes, so it is built once and only the
+            # small dynamic block below is formatted per call. The LLM used to get
+            # this as a rendered ChatPromptTemplate ("Human: ..."), keep that tag.
+            self._static_prompt_prefix = "Human: " + """You are warm and friendly AI assistant - like the smiling team member who helps customers discover delicious treats!
             YOUR PERSONALITY:
             - Warm, enthusiastic, and genuinely helpful
             - You love sharing our menu and helping customers find what they crave
@@ -795,19 +1435,21 @@ class RAGBot:
 
             ---
 
-            DYNAMIC CONTEXT:
-            User Launguage: {launguge}
-            User Goals: {user_goal}
-            User Name: {user_name}
-            Context: {context}
-            Conversation History: {history}
-            User Message: {question}
-            ---
+            DYNAMIC CONTEXT:\n"""
+            prompt_dynamic = (
+                "            User Launguage: {launguge}\n"
+                "            User Goals: {user_goal}\n"
+                "            User Name: {user_name}\n"
+                "            Context: {context}\n"
+                "            Conversation History: {history}\n"
+                "            User Message: {question}\n"
+            )
+            self._static_prompt_suffix = """            ---
 
             Remember: When users express ORDER INTENT (want/need/get me), always guide them to type "order" first! Be friendly about it - you're helping them start their delicious journey! ❤️
 
                                                                
-            """)
+            """
 
             prompt_template_for_res = ChatPromptTemplate.from_template("""
             SYSTEM PROMPT:
@@ -885,8 +1527,29 @@ class RAGBot:
             "{text}"
             """
 
-            def get_context(inputs):
-                """Enhanced context retrieval with relevance checking."""
+            launguage_swap_batch_prompt = """
+            Translate each of the following texts into given launguage. 
+            Keep the meaning, tone, and style exactly the same.
+            Preserve all emojis exactly as they appear. Do not add new emojis and do not remove any.
+            Do not change numbers, names, or formatting.
+            MUST: DO NOT translate any command keywords inside single quotes or stars.
+            Example: 'order', **order**, 'exit', 'view_order', 'change_default_address', 'complain', 'ask_for_feature', 'Delivery', 'Pickup' and etc...
+            and also do not translate numbers also. 
+            Each text starts with a marker line like [[1]]. Return only the translated texts,
+            each under its own unchanged marker line, in the same order.
+
+            Launguage:
+            {language}
+
+            Texts:
+            {texts}
+            """
+
+            def get_context(inputs, semantic=True):
+                """
+                Enhanced context retrieval with relevance checking. The order chain passes
+                semantic=False so prices are never read from another query's context.
+                """
                 try:
                     if not self.retriever:
                         return "No retriever available."
@@ -895,7 +1558,7 @@ class RAGBot:
                     if not query:
                         return "Invalid query."
                     
-                    cached_data = self.cache.get_cached_query(query)
+                    cached_data = self.cache.get_cached_query(query, semantic=semantic)
                     if cached_data:
                         rag_logger.logger.info("✓ Using cached context")
                         return cached_data['context']
@@ -929,16 +1592,18 @@ class RAGBot:
                     rag_logger.log_error("get_context", e)
                     return "Error retrieving context."
             
+            def build_prompt(values):
+                """Render the chat prompt from the pre-built static parts."""
+                return self._static_prompt_prefix + prompt_dynamic.format(**values) + self._static_prompt_suffix
+
             def format_history(inputs):
                 """Format conversation history with better structure."""
                 try:
-                    history = self.cache.get_history(self.client_id)
+                    recent_history = self.cache.get_recent_history(self.client_id, 1)
                     
-                    if not history:
+                    if not recent_history:
                         return "No previous conversation."
                     
-                    recent_history = history[-1:] if len(history) > 1 else history
-                    
                     formatted = []
                     for exchange in recent_history:
                         if isinstance(exchange, dict):
@@ -964,16 +1629,16 @@ class RAGBot:
                     "user_name": lambda x: x.get("user_name", "User"),
                     "user_goal": lambda x: x.get("user_goal", "None")
                 })
-                | prompt_template
+                | RunnableLambda(build_prompt)
                 | self.llm
                 | StrOutputParser()
             )
 
-            parser_res = StructuredOutputParser.from_response_schemas(schemas)
+            parser_res = FastStructuredOutputParser.from_response_schemas(schemas)
 
             self.chain_res = (
                 RunnableParallel({
-                    "context": get_context,
+                    "context": lambda x: get_context(x, semantic=False),
                     "question": lambda x: sanitize_query(x.get("question", "")) if isinstance(x, dict) else sanitize_query(str(x)),
                     "history": lambda x: format_history(x) if isinstance(x, dict) else "No history."
                 })
@@ -982,22 +1647,9 @@ class RAGBot:
                 | parser_res
             )
 
-            from langchain.prompts import PromptTemplate
-
-            translation_prompt = PromptTemplate(
-                input_variables=["language", "text"],
-                template=launguage_swap_prompt
-            )
-
-            self.translation_chain = (
-                RunnableParallel({
-                    "text": lambda x: x.get("text", ""),
-                    "language": lambda x: x.get("language", "English")
-                })
-                | translation_prompt
-                | self.llm
-                | StrOutputParser()
-            )
+            # invoke_translation(_batch) format these and send them straight to the LLM
+            self._translation_template = launguage_swap_prompt
+            self._translation_batch_template = launguage_swap_batch_prompt
 
         except Exception as e:
             rag_logger.log_error("_setup_chain", e)
@@ -1017,18 +1669,19 @@ class RAGBot:
             query = str(query)
 
             self.cache.add_to_history(self.client_id, 'user', query)
-            
-            from manager import extract_goals_from_FB, extract_name_from_FB
 
-            try:
-                current_user_name = extract_name_from_FB(mobile_number=self.sender_number, client_id=self.client_id)
-            except:
+            # Both profile lookups are independent Firestore reads, so run them side by side
+            current_user_name, current_user_goals = await asyncio.gather(
+                asyncio.to_thread(extract_name_from_FB, mobile_number=self.sender_number, client_id=self.client_id),
+                asyncio.to_thread(extract_goals_from_FB, mobile_number=self.sender_number, client_id=self.client_id),
+                return_exceptions=True
+            )
+            
+            if isinstance(current_user_name, BaseException):
                 logger.log_error("user_name. RAGBot. Rag.py", "Failed to get the user name for now.")
                 current_user_name = "User"
             
-            try:
-                current_user_goals = extract_goals_from_FB(mobile_number=self.sender_number, client_id=self.client_id)
-            except:
+            if isinstance(current_user_goals, BaseException):
                 logger.log_error("user_goals. RAGBOT. Rag.py", "Failed to get the user number for now.")
                 current_user_goals = "None"
 
@@ -1040,15 +1693,15 @@ class RAGBot:
             }
             
             start_time = time.time()
-            response = self.chain.invoke(inputs)
+            response = await self.chain.ainvoke(inputs)
             duration_ms = (time.time() - start_time) * 1000
             
-            # ✅ NEW: Validate response completeness
-            if not response or len(response.strip()) < 3:
+            # ✅ NEW: Validate response completeness (strip once; it returns the same object when already clean)
+            response = response.strip() if response else ""
+            if len(response) < 3:
                 response = "I apologize, but I couldn't generate a proper response. Could you rephrase your question?"
             
             # ✅ NEW: Check if response seems incomplete
-            response = response.strip()
             
             # Check for incomplete sentences (doesn't end with proper punctuation)
             if response and len(response) > 20:
@@ -1065,9 +1718,8 @@ class RAGBot:
             return response
             
         except Exception as e:
-            from encryption_utils import hash_for_logging
             rag_logger.log_error("invoke", e, {
-                "client_id": hash_for_logging(self.client_id), 
+                "client_id": self._client_id_hashed, 
                 "query_length": len(query) if query else 0
             })
             return "I encountered an error processing your request. Please try again later."
@@ -1097,7 +1749,7 @@ class RAGBot:
             start_time = time.time()
             
             # STEP 1: Get LLM extraction
-            response = self.chain_res.invoke(inputs)
+            response = await self.chain_res.ainvoke(inputs)
             
             duration_ms = (time.time() - start_time) * 1000
             
@@ -1116,41 +1768,41 @@ class RAGBot:
             extracted_price = response.get("price")
             
             if foodname and extracted_price is not None:
-                # Get fresh context to verify price
+                # Get context to verify price
                 try:
-                    # Retrieve menu context
-                    if not self.retriever:
-                        rag_logger.log_warning("invokeforRes", "No retriever available for verification")
-                    else:
-                        # Search for the specific item in menu
-                        search_query = f"{foodname} {size if size else ''} price"
-                        docs = self.retriever.invoke(search_query)
-                        
-                        if docs:
-                            # Extract prices from menu context
-                            menu_context = "\n".join([doc.page_content for doc in docs])
-                            verified_price = self._extract_price_from_menu(
-                                menu_context, foodname, size
+                    # Reuse the context the chain just retrieved when it already mentions the item
+                    menu_context = None
+                    verified_price = None
+                    chain_context = self.cache.peek_context(sanitize_query(inputs["question"]))
+                    if chain_context and foodname in chain_context.lower():
+                        menu_context = chain_context
+                        verified_price = self._extract_price_from_menu(menu_context, foodname, size)
+                    
+                    if verified_price is None:
+                        # Scan the whole menu text directly; every retrieved chunk is a
+                        # substring of it, so a retriever round trip cannot find more
+                        menu_context = self._menu_text
+                        verified_price = self._extract_price_from_menu(menu_context, foodname, size)
+                    
+                    if menu_context is not None:
+                        # VERIFICATION: Compare prices
+                        if verified_price is not None and verified_price != extracted_price:
+                            rag_logger.log_error(
+                                "invokeforRes.price_mismatch",
+                                f"Item: {foodname}, Extracted: ₹{extracted_price}, Menu: ₹{verified_price}"
+                            )
+                            # FORCE CORRECT PRICE
+                            response["price"] = verified_price
+                            rag_logger.logger.info(f"Price corrected: {foodname} ₹{extracted_price} → ₹{verified_price}")
+                        elif verified_price is not None:
+                            # Prices match - all good
+                            rag_logger.logger.info(f"Price verified: {foodname} ₹{verified_price} ✓")
+                        else:
+                            # Could not verify - log warning but keep extracted price
+                            rag_logger.log_warning(
+                                "invokeforRes.verification_failed",
+                                f"Could not verify price for {foodname} from menu"
                             )
-                            
-                            # VERIFICATION: Compare prices
-                            if verified_price is not None and verified_price != extracted_price:
-                                rag_logger.log_error(
-                                    "invokeforRes.price_mismatch",
-                                    f"Item: {foodname}, Extracted: ₹{extracted_price}, Menu: ₹{verified_price}"
-                                )
-                                # FORCE CORRECT PRICE
-                                response["price"] = verified_price
-                                rag_logger.logger.info(f"Price corrected: {foodname} ₹{extracted_price} → ₹{verified_price}")
-                            elif verified_price is not None:
-                                # Prices match - all good
-                                rag_logger.logger.info(f"Price verified: {foodname} ₹{verified_price} ✓")
-                            else:
-                                # Could not verify - log warning but keep extracted price
-                                rag_logger.log_warning(
-                                    "invokeforRes.verification_failed",
-                                    f"Could not verify price for {foodname} from menu"
-                                )
                       
                 except Exception as verify_error:
                     rag_logger.log_error("invokeforRes.verification_error", verify_error)
@@ -1180,46 +1832,30 @@ class RAGBot:
         Returns:
             Price as float, or None if not found
         """
-        import re
-        
         try:
             # Normalize inputs
             foodname = foodname.lower().strip()
             size = size.lower().strip() if size else None
             menu_context = menu_context.lower()
             
-            # Build search pattern
-            # Matches: "masala dosa ....... ₹90" or "masala dosa - ₹90" or "masala dosa: 90"
-            patterns = [
-                # Pattern 1: Item name followed by dots/dashes and price
-                rf"{re.escape(foodname)}\s*[.\-:]*\s*(?:₹|rs\.?|inr)?\s*(\d+(?:\.\d{{1,2}})?)",
-                # Pattern 2: With size
-                rf"{re.escape(foodname)}\s+{re.escape(size) if size else ''}\s*[.\-:]*\s*(?:₹|rs\.?|inr)?\s*(\d+(?:\.\d{{1,2}})?)",
-                # Pattern 3: Size before item
-                rf"{re.escape(size) if size else ''}\s+{re.escape(foodname)}\s*[.\-:]*\s*(?:₹|rs\.?|inr)?\s*(\d+(?:\.\d{{1,2}})?)",
-            ]
+            # Every pattern below (and the fallback) needs the item name verbatim
+            item_pos = menu_context.find(foodname)
+            if item_pos == -1:
+                return None
             
-            for pattern in patterns:
-                if not pattern.strip():  # Skip empty patterns
-                    continue
-                    
-                matches = re.findall(pattern, menu_context, re.IGNORECASE)
+            for pattern in _menu_price_patterns(foodname, size):
+                matches = pattern.findall(menu_context)
                 if matches:
                     # Return first match as float
                     price = float(matches[0])
                     return price
             
-            # Fallback: Search for item name and extract nearby price
-            # Find item position
-            item_pos = menu_context.find(foodname)
-            if item_pos != -1:
-                # Extract 100 chars after item name
-                nearby_text = menu_context[item_pos:item_pos + 100]
-                # Search for any price pattern
-                price_pattern = r'(?:₹|rs\.?|inr)?\s*(\d+(?:\.\d{1,2})?)'
-                matches = re.findall(price_pattern, nearby_text)
-                if matches:
-                    return float(matches[0])
+            # Fallback: extract a price from the 100 chars after the item name
+            nearby_text = menu_context[item_pos:item_pos + 100]
+            # Search for any price pattern
+            matches = _PRICE_RE.findall(nearby_text)
+            if matches:
+                return float(matches[0])
             
             return None
             
@@ -1230,40 +1866,149 @@ class RAGBot:
 
     async def invoke_translation(self, text: str, target_language: str) -> str:
         """
-        Minimal invocation for the translation_chain.
-        Only translates the text and returns the output.
+        Minimal translation call: formats the translation prompt and sends it
+        straight to the LLM. Only translates the text and returns the output.
         """
         try:
             if not text or not isinstance(text, str):
                 return "Invalid text."
 
-            if not self.translation_chain:
+            if not self.llm or not self._translation_template:
                 return "Translation system not ready."
 
             if target_language.lower() in ["english"] or target_language.lower() == "english":
                 return text
             
-            payload = {
-                "text": text,
-                "language": target_language
-            }
+            # Already in the target language's script: skip the LLM round-trip
+            script = _TRANSLATION_SCRIPTS.get(target_language.strip().lower())
+            if script and _is_written_in(text, *script):
+                return text
+            
+            # Very long texts: translate sentence-aligned pieces concurrently to bound each prompt
+            if len(text) > MAX_TRANSLATE_CHARS:
+                pieces = _split_for_translation(text)
+                if len(pieces) > 1:
+                    translated_pieces = await asyncio.gather(*[
+                        self.invoke_translation(piece, target_language) for piece, _ in pieces
+                    ])
+                    return "".join(t + separator for t, (_, separator) in zip(translated_pieces, pieces))
+            
+            cache_key = _translation_key(text, target_language)
+            cached = _recall_translation(cache_key)
+            if cached is not None:
+                return cached
+            
+            # An identical translation is already running: wait for it instead of calling the LLM again
+            loop = asyncio.get_running_loop()
+            pending = _TRANSLATION_INFLIGHT.get(cache_key)
+            if pending is not None and pending.get_loop() is loop:
+                return await asyncio.shield(pending)
+            
+            inflight = loop.create_future()
+            _TRANSLATION_INFLIGHT[cache_key] = inflight
+            translated = text  # fallback to original text
+            try:
+                prompt = self._translation_template.format(language=target_language, text=text)
+                result = await self.llm._acall_api(prompt)
+
+                # Failure replies are not translations; keep the original text and don't cache them
+                if result and result not in _GEMINI_FAILURE_REPLIES:
+                    translated = result.strip()
+                    _remember_translation(cache_key, translated)
+                return translated
+            finally:
+                # Waiters get the same answer, or the untranslated text if this call failed
+                if not inflight.done():
+                    inflight.set_result(translated)
+                if _TRANSLATION_INFLIGHT.get(cache_key) is inflight:
+                    del _TRANSLATION_INFLIGHT[cache_key]
 
-            # Run the chain (async)
-            result = await self.translation_chain.ainvoke(payload)
+        except Exception as e:
+            rag_logger.log_error("invoke_translation. RAGBot. Rag.py", e)
+            return text  # fallback to original text
 
-            if not result:
-                return text  # fallback without doing anything
+    async def invoke_translation_batch(self, texts: List[str], target_language: str) -> List[str]:
+        """
+        Translate many short texts with one LLM call per TRANSLATION_BATCH_MAX uncached texts.
+        Results line up with `texts`; anything that can't be translated comes back unchanged.
+        """
+        try:
+            if not texts:
+                return []
 
-            return result.strip()
+            if not self.llm or not self._translation_template:
+                return ["Translation system not ready."] * len(texts)
+
+            results = list(texts)
+            if target_language.lower() == "english":
+                return results
+
+            script = _TRANSLATION_SCRIPTS.get(target_language.strip().lower())
+            pending: Dict[Tuple[str, str], List[int]] = {}
+            for i, text in enumerate(texts):
+                if not text or not isinstance(text, str):
+                    results[i] = "Invalid text."
+                    continue
+                if script and _is_written_in(text, *script):
+                    continue
+                cache_key = _translation_key(text, target_language)
+                cached = _recall_translation(cache_key)
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    pending.setdefault(cache_key, []).append(i)
+
+            keys = list(pending)
+            batches = [keys[i:i + TRANSLATION_BATCH_MAX] for i in range(0, len(keys), TRANSLATION_BATCH_MAX)]
+            translated_batches = await asyncio.gather(*[
+                self._translate_batch([texts[pending[key][0]] for key in batch], target_language)
+                for batch in batches
+            ])
+
+            for batch, translated in zip(batches, translated_batches):
+                for key, translation in zip(batch, translated):
+                    for i in pending[key]:
+                        results[i] = translation
+            return results
 
         except Exception as e:
-            rag_logger.log_error("invoke_translation. RAGBot. Rag.py", e)
-            return text  # fallback to original text
+            rag_logger.log_error("invoke_translation_batch. RAGBot. Rag.py", e)
+            return list(texts)  # fallback to original texts
+
+    async def _translate_batch(self, texts: List[str], target_language: str) -> List[str]:
+        """Translate uncached texts in one numbered prompt; texts missing from the reply are retried singly."""
+        if len(texts) == 1 or not self._translation_batch_template:
+            return list(await asyncio.gather(*[self.invoke_translation(text, target_language) for text in texts]))
+
+        numbered = "\n".join(f"[[{n}]]\n{text}" for n, text in enumerate(texts, 1))
+        prompt = self._translation_batch_template.format(language=target_language, texts=numbered)
+        result = await self.llm._acall_api(prompt)
+
+        by_number: Dict[int, str] = {}
+        if result and result not in _GEMINI_FAILURE_REPLIES:
+            parts = _TRANSLATION_MARKER_RE.split(result)
+            # parts = [preamble, "1", text1, "2", text2, ...]
+            for number, segment in zip(parts[1::2], parts[2::2]):
+                segment = segment.strip()
+                if segment:
+                    by_number.setdefault(int(number), segment)
+
+        translations: List[Optional[str]] = [by_number.get(n) for n in range(1, len(texts) + 1)]
+        for text, translation in zip(texts, translations):
+            if translation is not None:
+                _remember_translation(_translation_key(text, target_language), translation)
+
+        missing = [i for i, translation in enumerate(translations) if translation is None]
+        if missing:
+            retried = await asyncio.gather(*[self.invoke_translation(texts[i], target_language) for i in missing])
+            for i, translation in zip(missing, retried):
+                translations[i] = translation
+        return translations
 
     def clear_conversation(self):
         """Clear conversation history for this client."""
         self.cache.clear_history(self.client_id)
-        rag_logger.logger.info(f"✓ Cleared history for {hash_for_logging(self.client_id)}")
+        rag_logger.logger.info(f"✓ Cleared history for {self._client_id_hashed}")
 
     def get_conversation_history(self) -> List[Dict[str, str]]:
         """Get current conversation history."""
@@ -1280,7 +2025,10 @@ class RAGBot:
             "client_id": self.client_id,
             "document_length": len(self.document_text),
             "cached_chunks": len(self.cache.chunks) if self.cache.chunks else 0,
-            "conversation_length": len(self.cache.get_history(self.client_id)),
+            "conversation_length": self.cache.history_length(self.client_id),
             "query_cache_size": len(self.cache.query_cache),
+            "query_cache_hits": self.cache.hits,
+            "query_cache_misses": self.cache.misses,
+            "translation_cache_size": len(_TRANSLATION_CACHE),
             "vectorstore_cached": self.cache.has_vectorstore()
         }
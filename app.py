@@ -4,7 +4,7 @@
 import httpx
 from fastapi import FastAPI, Request, HTTPException
 from dotenv import load_dotenv
-from fastapi.responses import PlainTextResponse, JSONResponse
+from fastapi.responses import PlainTextResponse, JSONResponse, ORJSONResponse
 from firebase import get_client_id_by_phone_id, get_client, get_all_non_members_from_firebase, formate_number, get_client_by_email, decrypt_client_data, create_jwt, read_file_content, add_universal_client, add_customer_to_firebase, add_non_members_to_firebase, update_uploaded_document, decode_jwt, initialize_firebase
 from handle_all_things import handle_user_message, handle_user_message_restaurents, handle_user_message_bakery, handle_user_message_free_version, handle_user_message_cloth_store
 from Rag import RAGBot
@@ -1759,7 +1759,7 @@ if __name__ == "__main__":
 # Admin Endpoints (Optional - for cache management)
 # ============================================================================
 
-@app.get("/cache/stats")
+@app.get("/cache/stats", response_class=ORJSONResponse)
 async def get_cache_stats(authenticated: bool = Depends(authenticate_admin)):
     """Get cache statistics."""
     return rag_cache.get_stats()
@@ -688,6 +688,53 @@ def cleanup_old_rag_caches(days_old: int = 30):
         logger.log_error("cleanup_old_rag_caches", e)
         return 0
 
+
+def get_cached_translation(cache_key: str, max_age_days: int = 14) -> Optional[str]:
+    """
+    Retrieve a persisted translation so restarts don't repeat translation API calls.
+    
+    Args:
+        cache_key: Translator cache key (hashed before use as a document id)
+        max_age_days: Entries older than this are treated as missing
+        
+    Returns:
+        Translated text, or None if not cached or expired
+    """
+    try:
+        doc = db.collection("translation_cache").document(deterministic_hash(cache_key)).get()
+        if not doc.exists:
+            return None
+        
+        data = doc.to_dict()
+        updated_at = data.get("updated_at")
+        if updated_at and datetime.now(timezone.utc) - updated_at > timedelta(days=max_age_days):
+            return None
+        
+        translated = data.get("translated")
+        return decrypt_data(translated) if translated else None
+        
+    except Exception as e:
+        logger.log_error("get_cached_translation", e)
+        return None
+
+
+def save_cached_translation(cache_key: str, translated: str):
+    """
+    Persist a translation (encrypted) for reuse across processes and restarts.
+    
+    Args:
+        cache_key: Translator cache key (hashed before use as a document id)
+        translated: Translated text
+    """
+    try:
+        db.collection("translation_cache").document(deterministic_hash(cache_key)).set({
+            "translated": encrypt_data(translated),
+            "updated_at": datetime.now(timezone.utc)
+        })
+        
+    except Exception as e:
+        logger.log_error("save_cached_translation", e)
+
 try:
     SECRETE_JWT_KEY = load_env_from_secret("JWT_SECRET_KEY")
 except Exception as e:
@@ -0,0 +1,46 @@
+import pytest
+
+Features = pytest.importorskip("Features")
+
+
+@pytest.fixture
+def translator(monkeypatch):
+    """EfficientTranslator whose Google calls are recorded instead of sent."""
+    calls = []
+
+    def fake_translate(text, source_lang, target_lang, timeout=None):
+        calls.append((text, source_lang, target_lang))
+        return f"translated:{text}"
+
+    monkeypatch.setattr(Features, "translate_with_timeout", fake_translate)
+    monkeypatch.setattr(Features, "get_cached_translation", lambda key: None)
+    monkeypatch.setattr(Features, "save_cached_translation", lambda key, value: None)
+    t = Features.EfficientTranslator()
+    t.calls = calls
+    return t
+
+
+@pytest.mark.parametrize("source_lang", ["english", "EN", " English ", "en"])
+def test_caller_supplied_english_skips_translation(translator, source_lang):
+    text = "मेरा ऑर्डर कहाँ है"
+
+    result = translator.translate_to_english(text, source_lang)
+
+    assert result == (text, "English")
+    assert translator.calls == []
+
+
+@pytest.mark.parametrize("source_lang", ["hindi", "HI", "Hindi"])
+def test_caller_supplied_language_is_normalized(translator, source_lang):
+    text = "मेरा ऑर्डर कहाँ है"
+
+    result = translator.translate_to_english(text, source_lang)
+
+    assert result == (f"translated:{text}", "Hindi")
+    assert translator.calls == [(text, "hi", "en")]
+
+
+def test_unknown_source_lang_falls_back_to_detection(translator):
+    text = "मेरा ऑर्डर कहाँ है"
+
+    assert translator.translate_to_english(text, "klingon")[1] == "Hindi"
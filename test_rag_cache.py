@@ -0,0 +1,49 @@
+import pytest
+
+Rag = pytest.importorskip("Rag")
+
+
+def make_cache():
+    """RAGCache whose embedder maps every query to the same vector, so any two queries are 'paraphrases'."""
+    cache = Rag.RAGCache()
+    cache.set_embedder(lambda text: [1.0, 0.0, 0.0])
+    return cache
+
+
+def test_semantic_hit_for_paraphrase_with_same_size():
+    cache = make_cache()
+    cache.cache_query_result("price of large pizza", "large pizza context")
+
+    data = cache.get_cached_query("what is the price of large pizza")
+
+    assert data is not None
+    assert data["context"] == "large pizza context"
+
+
+def test_different_sizes_do_not_collide():
+    cache = make_cache()
+    cache.cache_query_result("price of large pizza", "large pizza context")
+
+    assert cache.get_cached_query("price of medium pizza") is None
+
+
+def test_different_quantities_do_not_collide():
+    cache = make_cache()
+    cache.cache_query_result("2 chocolate brownies", "two brownies context")
+
+    assert cache.get_cached_query("3 chocolate brownies") is None
+
+
+def test_exact_only_lookup_ignores_paraphrases():
+    cache = make_cache()
+    cache.cache_query_result("price of large pizza", "large pizza context")
+
+    assert cache.get_cached_query("what is the price of large pizza", semantic=False) is None
+
+
+def test_paraphrase_hit_is_not_stored_under_new_query():
+    cache = make_cache()
+    cache.cache_query_result("price of large pizza", "large pizza context")
+
+    assert cache.get_cached_query("what is the price of large pizza") is not None
+    assert cache.peek_context("what is the price of large pizza") is None